@@ -1,2 +1,3 @@
 from .config import load_config
 from .startup import on_startup
+from .shutdown import on_shutdown
@@ -1,6 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 from environs import Env
-from aiogram.fsm.storage.memory import MemoryStorage, BaseStorage
+from marshmallow.validate import Range, Regexp
+from aiogram.fsm.storage.base import BaseEventIsolation
+from aiogram.fsm.storage.memory import BaseStorage, SimpleEventIsolation
+from config.storage import BoundedMemoryStorage, IDLE_TTL, MEMORY_BUDGET
 
 
 @dataclass
@@ -11,33 +15,112 @@ class DatabaseConfig:
     host: str
     port: str
     driver: str
+    echo: bool = True
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_pre_ping: bool = False
+    pool_recycle: int = -1
+    statement_cache_size: int = 100
+    statement_timeout: int | None = None
+    replica_urls: list[str] = field(default_factory=list)
 
     def __post_init__(self):
         self.dsn = f'postgres://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}'
         self.url = f'postgresql+{self.driver}://{self.user}:{self.password}@{self.host}/{self.db_name}'
 
+    @property
+    def engine_options(self) -> dict[str, Any]:
+        options = {
+            'echo': self.echo,
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_timeout': self.pool_timeout,
+            'pool_pre_ping': self.pool_pre_ping,
+            'pool_recycle': self.pool_recycle
+        }
+        if self.driver == 'asyncpg':
+            connect_args: dict[str, Any] = {'statement_cache_size': self.statement_cache_size}
+            if self.statement_timeout:
+                connect_args['server_settings'] = {'statement_timeout': str(self.statement_timeout)}
+            options['connect_args'] = connect_args
+        return options
+
 
 @dataclass
 class BotConfig:
     token: str
     storage: BaseStorage
+    events_isolation: BaseEventIsolation
     admin_ids: list[int]
 
 
+@dataclass
+class WebhookConfig:
+    enabled: bool = False
+    base_url: str | None = None
+    path: str = '/webhook'
+    secret: str | None = None
+    host: str = '0.0.0.0'
+    port: int = 8080
+    workers: int = 1
+
+    @property
+    def url(self) -> str:
+        return f'{self.base_url.rstrip("/")}{self.path}'
+
+
+def create_storage(env: Env) -> BaseStorage:
+    if env('FSM_STORAGE', 'memory') == 'redis':
+        from aiogram.fsm.storage.redis import RedisStorage
+        return RedisStorage.from_url(env('REDIS_URL'))
+    return BoundedMemoryStorage(
+        idle_ttl=env.int('FSM_IDLE_TTL', IDLE_TTL),
+        memory_budget=env.int('FSM_MEMORY_BUDGET', MEMORY_BUDGET)
+    )
+
+
 @dataclass
 class Config:
     bot: BotConfig
     db: DatabaseConfig
+    webhook: WebhookConfig
+    redis_url: str | None = None
+
+
+def load_webhook_config(env: Env) -> WebhookConfig:
+    if env('BOT_MODE', 'polling') != 'webhook':
+        return WebhookConfig()
+    return WebhookConfig(
+        enabled=True,
+        base_url=env('WEBHOOK_BASE_URL', validate=Regexp(r'^https://\S+$', error='must be an https:// URL')),
+        path=env('WEBHOOK_PATH', '/webhook'),
+        secret=env(
+            'WEBHOOK_SECRET',
+            validate=Regexp(r'^[A-Za-z0-9_-]{1,256}$', error='must be 1-256 characters of A-Z, a-z, 0-9, _ and -')
+        ),
+        host=env('WEBHOOK_HOST', '0.0.0.0'),
+        port=env.int('WEBHOOK_PORT', 8080),
+        workers=env.int('WEBHOOK_WORKERS', 1, validate=Range(min=1))
+    )
+
+
+def create_events_isolation(storage: BaseStorage) -> BaseEventIsolation:
+    if hasattr(storage, 'create_isolation'):
+        return storage.create_isolation()
+    return SimpleEventIsolation()
 
 
 def load_config() -> Config:
     env: Env = Env()
     env.read_env()
+    storage = create_storage(env)
 
     return Config(
         bot=BotConfig(
             token=env('BOT_TOKEN'),
-            storage=MemoryStorage(),
+            storage=storage,
+            events_isolation=create_events_isolation(storage),
             admin_ids=[int(admin_id) for admin_id in env.list('ADMIN_IDS')]
         ),
         db=DatabaseConfig(
@@ -46,6 +129,17 @@ def load_config() -> Config:
             password=env('DB_PASSWORD'),
             host=env('DB_HOST'),
             port=env('DB_PORT'),
-            driver=env('DB_DRIVER')
-        )
+            driver=env('DB_DRIVER'),
+            echo=env.bool('DB_ECHO', True),
+            pool_size=env.int('DB_POOL_SIZE', 5),
+            max_overflow=env.int('DB_MAX_OVERFLOW', 10),
+            pool_timeout=env.float('DB_POOL_TIMEOUT', 30),
+            pool_pre_ping=env.bool('DB_POOL_PRE_PING', False),
+            pool_recycle=env.int('DB_POOL_RECYCLE', -1),
+            statement_cache_size=env.int('DB_STATEMENT_CACHE_SIZE', 100),
+            statement_timeout=env.int('DB_STATEMENT_TIMEOUT', None),
+            replica_urls=env.list('DB_REPLICA_URLS', [])
+        ),
+        webhook=load_webhook_config(env),
+        redis_url=env('REDIS_URL', None)
     )
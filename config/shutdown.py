@@ -0,0 +1,40 @@
+import logging
+from aiogram import Dispatcher
+from sqlalchemy.ext.asyncio import AsyncEngine
+from database.pool import pool_metrics
+from middlewares import SessionStats, StateStats
+from services.reference import ReferenceService
+from services.invalidation import InvalidationService
+from services.menu import MenuService, ScheduleService
+from services.broadcast import Broadcaster
+from services.throttling import RequestScheduler
+from config.storage import BoundedMemoryStorage
+
+logger = logging.getLogger(__name__)
+
+
+async def on_shutdown(
+        engine: AsyncEngine,
+        replica_engines: list[AsyncEngine],
+        session_stats: SessionStats,
+        state_stats: StateStats,
+        broadcaster: Broadcaster,
+        request_scheduler: RequestScheduler,
+        dispatcher: Dispatcher):
+    await broadcaster.stop()
+    await InvalidationService.stop()
+    if isinstance(dispatcher.storage, BoundedMemoryStorage):
+        logger.info('FSM memory storage: %s', dispatcher.storage.stats())
+    logger.info('Telegram request scheduler metrics: %s', request_scheduler.metrics())
+    await request_scheduler.close()
+    logger.info('Database sessions opened for %s of %s updates, replica sessions: %s',
+                session_stats.sessions, session_stats.updates, session_stats.replica_sessions)
+    logger.info('FSM storage reads: %s (saved %s), writes: %s (saved %s)',
+                state_stats.reads, state_stats.reads_saved, state_stats.writes, state_stats.writes_saved)
+    logger.info('Database pool metrics: %s', pool_metrics(engine))
+    logger.info('Reference cache hits/misses: %s', ReferenceService.stats())
+    logger.info('Menu snapshot cache hits/misses/size: %s', MenuService.stats())
+    logger.info('Menu schedule hits/refreshes: %s', ScheduleService.stats())
+    await engine.dispose()
+    for replica in replica_engines:
+        await replica.dispose()
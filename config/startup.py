@@ -1,5 +1,8 @@
 from aiogram import Bot
 from aiogram.types import BotCommand
+from sqlalchemy.ext.asyncio import AsyncEngine
+from database.schema import check_indexes
+from services.broadcast import Broadcaster
 
 DESCRIPTION = '''
 Добро пожаловать в бот заказа питания в столовой ГК "ОТЭКО".
@@ -35,6 +38,10 @@ async def set_main_menu(bot: Bot):
     await bot.set_my_commands(commands=commands)
 
 
-async def on_startup(bot: Bot):
+async def on_startup(bot: Bot, engine: AsyncEngine, broadcaster: Broadcaster, worker: int):
+    broadcaster.watch()
+    if worker:
+        return
+    await check_indexes(engine)
     await set_main_menu(bot)
     await bot.set_my_description(DESCRIPTION)
@@ -0,0 +1,110 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from exceptions import StateTooLarge
+
+logger = logging.getLogger(__name__)
+
+IDLE_TTL = 6 * 60 * 60
+MEMORY_BUDGET = 64 * 1024 * 1024
+
+
+@dataclass
+class ContextRecord:
+    state: str | None = field(default=None)
+    data: dict[str, Any] = field(default_factory=dict)
+    size: int = field(default=0)
+    touched_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class StorageStats:
+    contexts: int = field(default=0)
+    size: int = field(default=0)
+    evicted_idle: int = field(default=0)
+    evicted_budget: int = field(default=0)
+
+
+class BoundedMemoryStorage(BaseStorage):
+
+    def __init__(self, idle_ttl: float = IDLE_TTL, memory_budget: int = MEMORY_BUDGET):
+        self.idle_ttl = idle_ttl
+        self.memory_budget = memory_budget
+        self._records: OrderedDict[StorageKey, ContextRecord] = OrderedDict()
+        self._stats = StorageStats()
+
+    @staticmethod
+    def _measure(record: ContextRecord) -> int:
+        return len(record.state or '') + len(json.dumps(record.data))
+
+    def _evict(self, keep: StorageKey | None = None) -> None:
+        now = time.monotonic()
+        while self._records:
+            key, record = next(iter(self._records.items()))
+            if key == keep:
+                break
+            if now - record.touched_at > self.idle_ttl:
+                self._stats.evicted_idle += 1
+            elif self._stats.size > self.memory_budget:
+                self._stats.evicted_budget += 1
+            else:
+                break
+            self._drop(key)
+
+    def _drop(self, key: StorageKey) -> None:
+        record = self._records.pop(key)
+        self._stats.size -= record.size
+
+    def _get(self, key: StorageKey) -> ContextRecord | None:
+        self._evict()
+        record = self._records.get(key)
+        if record is not None:
+            record.touched_at = time.monotonic()
+            self._records.move_to_end(key)
+        return record
+
+    def _put(self, key: StorageKey, record: ContextRecord) -> None:
+        size = self._measure(record)
+        if size > self.memory_budget:
+            logger.error('FSM context %s of %s bytes exceeds the memory budget of %s bytes',
+                         key, size, self.memory_budget)
+            raise StateTooLarge(key)
+        if key in self._records:
+            self._drop(key)
+        if record.state is None and not record.data:
+            return
+        record.size = size
+        record.touched_at = time.monotonic()
+        self._records[key] = record
+        self._stats.size += record.size
+        self._evict(keep=key)
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        record = self._get(key) or ContextRecord()
+        self._put(key, ContextRecord(state=state.state if isinstance(state, State) else state, data=record.data))
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        record = self._get(key)
+        return record.state if record else None
+
+    async def set_data(self, key: StorageKey, data: dict[str, Any]) -> None:
+        record = self._get(key) or ContextRecord()
+        self._put(key, ContextRecord(state=record.state, data=data.copy()))
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        record = self._get(key)
+        return record.data.copy() if record else {}
+
+    def stats(self) -> StorageStats:
+        self._evict()
+        self._stats.contexts = len(self._records)
+        return self._stats
+
+    async def close(self) -> None:
+        self._records.clear()
+        self._stats.size = 0
@@ -0,0 +1,36 @@
+import asyncio
+import logging
+from aiohttp import web
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from config.config import WebhookConfig
+
+logger = logging.getLogger(__name__)
+
+
+async def set_webhook(bot: Bot, dispatcher: Dispatcher, webhook: WebhookConfig) -> None:
+    await bot.set_webhook(
+        url=webhook.url,
+        secret_token=webhook.secret,
+        allowed_updates=dispatcher.resolve_used_update_types(),
+        drop_pending_updates=True
+    )
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot, webhook: WebhookConfig, worker: int = 0) -> None:
+    app = web.Application()
+    SimpleRequestHandler(dispatcher=dp, bot=bot, secret_token=webhook.secret).register(app, path=webhook.path)
+    setup_application(app, dp, bot=bot)
+    if worker == 0:
+        dp.startup.register(set_webhook)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host=webhook.host, port=webhook.port, reuse_port=webhook.workers > 1)
+    await site.start()
+    logger.info('Worker %s is serving webhook on %s:%s%s', worker, webhook.host, webhook.port, webhook.path)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+        await bot.session.close()
@@ -0,0 +1,81 @@
+import datetime
+from typing import Any
+from sqlalchemy import select, insert, update, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import Broadcast
+
+
+class BroadcastRepository:
+    model = Broadcast
+
+    @classmethod
+    async def create_broadcast(cls, session: AsyncSession, data: dict[str, Any]) -> int:
+        query = insert(cls.model).values(**data).returning(cls.model.id)
+        result = await session.execute(query)
+        await session.commit()
+        return result.scalar_one()
+
+    @classmethod
+    async def get_broadcast(cls, session: AsyncSession, broadcast_id: int):
+        return await session.get(cls.model, broadcast_id)
+
+    @classmethod
+    async def claim_broadcasts(
+            cls,
+            session: AsyncSession,
+            owner: str,
+            lease: datetime.timedelta,
+            broadcast_id: int | None = None):
+        free = (
+            select(cls.model.id)
+            .where(cls.model.finished_at.is_(None))
+            .where(or_(cls.model.lease_until.is_(None), cls.model.lease_until < func.now(), cls.model.owner == owner))
+            .with_for_update(skip_locked=True)
+        )
+        if broadcast_id is not None:
+            free = free.where(cls.model.id == broadcast_id)
+        query = (
+            update(cls.model)
+            .where(cls.model.id.in_(free.scalar_subquery()))
+            .values(owner=owner, lease_until=func.now() + lease)
+            .returning(cls.model.id)
+        )
+        result = await session.execute(query)
+        await session.commit()
+        return sorted(result.scalars().all())
+
+    @classmethod
+    async def save_progress(
+            cls,
+            session: AsyncSession,
+            broadcast_id: int,
+            owner: str,
+            lease: datetime.timedelta,
+            last_tg_id: int,
+            sent: int,
+            failed: int) -> bool:
+        query = (
+            update(cls.model)
+            .where(cls.model.id == broadcast_id)
+            .where(cls.model.owner == owner)
+            .values(
+                last_tg_id=last_tg_id,
+                sent=cls.model.sent + sent,
+                failed=cls.model.failed + failed,
+                lease_until=func.now() + lease
+            )
+        )
+        result = await session.execute(query)
+        await session.commit()
+        return bool(result.rowcount)
+
+    @classmethod
+    async def finish_broadcast(cls, session: AsyncSession, broadcast_id: int, owner: str) -> None:
+        query = (
+            update(cls.model)
+            .where(cls.model.id == broadcast_id)
+            .where(cls.model.owner == owner)
+            .values(finished_at=datetime.datetime.now(), owner=None, lease_until=None)
+        )
+        await session.execute(query)
+        await session.commit()
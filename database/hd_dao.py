@@ -1,5 +1,6 @@
 from typing import Any
-from sqlalchemy import select, insert, update, delete
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import text
 from database.models import HdRequest, HdType
@@ -40,89 +41,89 @@ class HDRepository:
         await session.commit()
 
     @classmethod
-    async def get_requests_by_user_with_boundaries(cls, session: AsyncSession, user_id: int):
-        query = text(
-            '''
-            select y.*
-            from
-             (select x.*,
-                     coalesce(lag(x.id) over (order by x.id), max(x.id) over ()) as prev_id,
-                     coalesce(lead(x.id) over (order by x.id), min(x.id) over ()) as next_id
-              from 
-               (select hr.id, 
-                       ht.name, 
-                       hr.request_text, 
-                       hr.user_id, 
-                       hr.solution_text, 
-                       hr.created_at, 
-                       hr.done_at
-                from hd_request hr join hd_type ht on (hr.type_id = ht.id)
-                where hr.user_id = :user_id) x) y 
-            order by y.id desc
-            '''
-        )
-        result = await session.execute(query, {'user_id': user_id})
-        return result.mappings().all()
+    def _browse_filter(cls, model, user_id: int | None, only_new: bool) -> list:
+        clauses = []
+        if user_id is not None:
+            clauses.append(model.user_id == user_id)
+        if only_new:
+            clauses.append(model.done_at.is_(None))
+        return clauses
 
     @classmethod
-    async def get_new_requests_with_boundaries(cls, session: AsyncSession):
-        query = text('''
-                select y.*
-                from
-                 (select x.*,
-                   coalesce(lag(x.id) over (order by x.id), max(x.id) over ()) as prev_id,
-        	       coalesce(lead(x.id) over (order by x.id), min(x.id) over ()) as next_id
-                  from       
-                   (select hr.id, ht.name, hr.request_text, hr.user_id, hr.solution_text, hr.created_at, hr.done_at
-                    from hd_request hr join hd_type ht on (hr.type_id = ht.id)
-                    where hr.done_at is null) x) y
-                order by y.id desc
-                ''')
-        result = await session.execute(query)
-        return result.mappings().all()
-
-    @classmethod
-    async def get_all_requests_with_boundaries(cls, session: AsyncSession):
-        query = text('''
-                select y.*
-                from
-                 (select x.*,
-                    coalesce(lag(x.id) over (order by x.id), max(x.id) over ()) as prev_id,
-                	coalesce(lead(x.id) over (order by x.id), min(x.id) over ()) as next_id
-                 from       
-                  (select hr.id, ht.name, hr.request_text, hr.user_id, hr.solution_text, hr.created_at, hr.done_at
-                   from hd_request hr join hd_type ht on (hr.type_id = ht.id)) x) y
-                order by y.id desc
-                ''')
+    async def get_request_with_boundaries(
+            cls,
+            session: AsyncSession,
+            request_id: int | None = None,
+            user_id: int | None = None,
+            only_new: bool = False
+    ):
+        neighbour = aliased(cls.model)
+        neighbour_filter = cls._browse_filter(neighbour, user_id, only_new)
+        prev_id = func.coalesce(
+            select(neighbour.id)
+            .where(neighbour.id < cls.model.id, *neighbour_filter)
+            .order_by(neighbour.id.desc()).limit(1).scalar_subquery(),
+            select(func.max(neighbour.id)).where(*neighbour_filter).scalar_subquery(),
+            cls.model.id
+        )
+        next_id = func.coalesce(
+            select(neighbour.id)
+            .where(neighbour.id > cls.model.id, *neighbour_filter)
+            .order_by(neighbour.id).limit(1).scalar_subquery(),
+            select(func.min(neighbour.id)).where(*neighbour_filter).scalar_subquery(),
+            cls.model.id
+        )
+        query = (
+            select(
+                cls.model.id,
+                HdType.name,
+                cls.model.request_text,
+                cls.model.user_id,
+                cls.model.solution_text,
+                cls.model.created_at,
+                cls.model.done_at,
+                prev_id.label('prev_id'),
+                next_id.label('next_id')
+            )
+            .join(HdType, cls.model.type_id == HdType.id)
+        )
+        if request_id is None:
+            query = (
+                query.where(*cls._browse_filter(cls.model, user_id, only_new))
+                .order_by(cls.model.id.desc()).limit(1)
+            )
+        else:
+            query = query.where(cls.model.id == request_id, *cls._browse_filter(cls.model, user_id, False))
         result = await session.execute(query)
-        return result.mappings().all()
+        return result.mappings().one_or_none()
 
     @classmethod
-    async def get_bot_users(cls, session: AsyncSession):
+    async def get_bot_users(cls, session: AsyncSession, after_tg_id: int = 0, limit: int | None = None):
         query = text(
             '''
             select distinct tg_id 
             from customer c join customer_permission p on (c.id = p.customer_id)
             where c.tg_id is not null 
+              and c.tg_id > :after_tg_id
               and coalesce(p.end_date, current_date) >= current_date
               and p.beg_date <= current_date
+            order by tg_id
+            limit :limit
             '''
         )
-        result = await session.execute(query)
+        result = await session.execute(query, {'after_tg_id': after_tg_id, 'limit': limit})
         return result.scalars().all()
 
     @classmethod
-    async def auth_user_check(cls, session: AsyncSession, user_id: int):
+    async def count_bot_users(cls, session: AsyncSession) -> int:
         query = text(
             '''
-             select * from customer c 
-             where c.tg_id is not null
-               and c.tg_id = :user_id
-               and exists(select null from customer_permission p 
-			              where p.customer_id=c.id
-			                and coalesce(p.end_date, current_date) >= current_date
-                            and p.beg_date <= current_date)
+            select count(distinct tg_id) 
+            from customer c join customer_permission p on (c.id = p.customer_id)
+            where c.tg_id is not null 
+              and coalesce(p.end_date, current_date) >= current_date
+              and p.beg_date <= current_date
             '''
         )
-        result = await session.execute(query, {'user_id': user_id})
-        return result.scalars().one_or_none()
+        result = await session.execute(query)
+        return result.scalar_one()
@@ -1,4 +1,6 @@
-from sqlalchemy import select, update, ScalarResult, Executable, Result
+from typing import Any, Iterable
+from sqlalchemy import select, update, ScalarResult, Executable, Result, ColumnElement
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy.ext.asyncio import AsyncSession
 from database.models import *
 
@@ -10,21 +12,56 @@ class DbSessionManager:
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_obj_by_id(self, obj_cls: Obj.__class__, obj_id: int) -> Obj | None:
-        return await self._session.get(obj_cls, obj_id)
-
-    async def get_objs_by_attrs(self, obj_cls: Obj.__class__, **kwargs) -> ScalarResult[Obj]:
-        raw_result = await self._get_raw_result(obj_cls, **kwargs)
+    async def get_obj_by_id(
+            self, obj_cls: Obj.__class__, obj_id: int, options: Iterable[ORMOption] | None = None) -> Obj | None:
+        return await self._session.get(obj_cls, obj_id, options=options)
+
+    async def get_objs_by_ids(
+            self,
+            obj_cls: Obj.__class__,
+            obj_ids: Iterable[int],
+            options: Iterable[ORMOption] | None = None) -> list[Obj]:
+        obj_ids = list(obj_ids)
+        if not obj_ids:
+            return []
+        raw_result = await self._get_raw_result(obj_cls, obj_cls.id.in_(obj_ids), options=options)
+        objs = {obj.id: obj for obj in raw_result.scalars()}
+        return [objs[obj_id] for obj_id in obj_ids if obj_id in objs]
+
+    async def get_objs_by_attrs(
+            self, obj_cls: Obj.__class__, options: Iterable[ORMOption] | None = None, **kwargs) -> ScalarResult[Obj]:
+        raw_result = await self._get_raw_result(obj_cls, *self._attrs_criteria(obj_cls, kwargs), options=options)
         return raw_result.scalars()
 
-    async def get_obj_by_attrs(self, obj_cls: Obj.__class__, **kwargs) -> Obj | None:
-        raw_result = await self._get_raw_result(obj_cls, **kwargs)
+    async def get_obj_by_attrs(
+            self, obj_cls: Obj.__class__, options: Iterable[ORMOption] | None = None, **kwargs) -> Obj | None:
+        raw_result = await self._get_raw_result(obj_cls, *self._attrs_criteria(obj_cls, kwargs), options=options)
         return raw_result.scalar_one_or_none()
 
-    async def _get_raw_result(self, obj_cls: Obj.__class__, **kwargs) -> Result[Obj]:
-        stmt = select(obj_cls)
-        for attr, value in kwargs.items():
-            stmt = stmt.where(getattr(obj_cls, attr) == value)
+    async def get_objs_by_filter(
+            self,
+            obj_cls: Obj.__class__,
+            *criteria: ColumnElement[bool],
+            order_by: Iterable[ColumnElement] | None = None,
+            options: Iterable[ORMOption] | None = None) -> ScalarResult[Obj]:
+        raw_result = await self._get_raw_result(obj_cls, *criteria, order_by=order_by, options=options)
+        return raw_result.scalars()
+
+    @staticmethod
+    def _attrs_criteria(obj_cls: Obj.__class__, attrs: dict[str, Any]) -> list[ColumnElement[bool]]:
+        return [getattr(obj_cls, attr) == value for attr, value in attrs.items()]
+
+    async def _get_raw_result(
+            self,
+            obj_cls: Obj.__class__,
+            *criteria: ColumnElement[bool],
+            order_by: Iterable[ColumnElement] | None = None,
+            options: Iterable[ORMOption] | None = None) -> Result[Obj]:
+        stmt = select(obj_cls).where(*criteria)
+        if order_by:
+            stmt = stmt.order_by(*order_by)
+        if options:
+            stmt = stmt.options(*options)
         return await self._session.execute(stmt)
 
     # async def execute_stmt_with_one_or_none_return(self, stmt: Executable) -> Obj | None:
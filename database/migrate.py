@@ -0,0 +1,92 @@
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
+from config.config import load_config
+from database.pool import create_engine
+from database.schema import check_indexes
+from exceptions import MigrationError
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / 'migrations'
+MIGRATIONS_LOCK_ID = 5_417_001
+
+
+def _read_migrations() -> list[tuple[str, str]]:
+    return [(path.stem, path.read_text(encoding='utf-8')) for path in sorted(MIGRATIONS_DIR.glob('*.sql'))]
+
+
+def _split_statements(sql: str) -> list[str]:
+    lines = [line for line in sql.splitlines() if not line.lstrip().startswith('--')]
+    statements, current = [], ''
+    # semicolons inside $$ ... $$ bodies do not end a statement
+    for ind, part in enumerate('\n'.join(lines).split('$$')):
+        if ind % 2:
+            current += f'$${part}$$'
+            continue
+        first, *rest = part.split(';')
+        current += first
+        if rest:
+            statements.append(current)
+            *ended, current = rest
+            statements.extend(ended)
+    statements.append(current)
+    return [stmt.strip() for stmt in statements if stmt.strip()]
+
+
+def _checksum(sql: str) -> str:
+    return hashlib.sha256(sql.encode('utf-8')).hexdigest()
+
+
+async def _applied_migrations(conn: AsyncConnection) -> dict[str, str]:
+    await conn.execute(text(
+        '''
+        CREATE TABLE IF NOT EXISTS schema_migration (
+            version VARCHAR(255) PRIMARY KEY,
+            checksum CHAR(64) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+        '''
+    ))
+    result = await conn.execute(text('SELECT version, checksum FROM schema_migration'))
+    return dict(result.all())
+
+
+async def apply_migrations(engine: AsyncEngine) -> list[str]:
+    applied_now = []
+    async with engine.begin() as conn:
+        await conn.execute(text('SELECT pg_advisory_xact_lock(:lock_id)'), {'lock_id': MIGRATIONS_LOCK_ID})
+        applied = await _applied_migrations(conn)
+        for version, sql in _read_migrations():
+            checksum = _checksum(sql)
+            if version in applied:
+                if applied[version] != checksum:
+                    raise MigrationError(f'Migration {version} was changed after it had been applied')
+                continue
+            for stmt in _split_statements(sql):
+                await conn.execute(text(stmt))
+            await conn.execute(
+                text('INSERT INTO schema_migration (version, checksum) VALUES (:version, :checksum)'),
+                {'version': version, 'checksum': checksum}
+            )
+            applied_now.append(version)
+            logger.info('Applied migration %s', version)
+    return applied_now
+
+
+async def async_main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    engine = create_engine(load_config().db)
+    try:
+        applied = await apply_migrations(engine)
+        logger.info('Applied migrations: %s', ', '.join(applied) or 'none')
+        await check_indexes(engine)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(async_main())
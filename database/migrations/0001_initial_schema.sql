@@ -0,0 +1,101 @@
+-- CUSTOMER TABLES
+
+CREATE TABLE IF NOT EXISTS canteen (
+    id SMALLSERIAL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS delivery_place (
+    id SMALLSERIAL PRIMARY KEY,
+    name VARCHAR(80) NOT NULL,
+    begin_date DATE NOT NULL,
+    end_date DATE,
+    custom_menu BOOLEAN NOT NULL,
+    canteen_id SMALLINT NOT NULL REFERENCES canteen (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS customer (
+    id SERIAL PRIMARY KEY,
+    tg_id BIGINT,
+    phone_number VARCHAR(12) NOT NULL,
+    place_id SMALLINT REFERENCES delivery_place (id) ON DELETE SET NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_customer_phone_number ON customer (phone_number);
+
+CREATE TABLE IF NOT EXISTS customer_permission (
+    id SERIAL PRIMARY KEY,
+    beg_date DATE NOT NULL,
+    end_date DATE,
+    canteen_id SMALLINT NOT NULL REFERENCES canteen (id) ON DELETE CASCADE,
+    customer_id INTEGER NOT NULL REFERENCES customer (id) ON DELETE CASCADE
+);
+
+-- MENU TABLES
+
+CREATE TABLE IF NOT EXISTS meal_type (
+    id SMALLINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    name VARCHAR(20) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS menu (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(120) NOT NULL,
+    date DATE NOT NULL,
+    beg_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    canteen_id SMALLINT NOT NULL REFERENCES canteen (id) ON DELETE CASCADE,
+    meal_type_id SMALLINT NOT NULL REFERENCES meal_type (id) ON DELETE RESTRICT
+);
+
+CREATE TABLE IF NOT EXISTS menu_position (
+    id BIGSERIAL PRIMARY KEY,
+    name VARCHAR(120) NOT NULL,
+    weight VARCHAR(40),
+    cost NUMERIC(10, 2),
+    complex_qty SMALLINT,
+    menu_id INTEGER NOT NULL REFERENCES menu (id) ON DELETE CASCADE,
+    eis_doc_num SMALLINT,
+    color_num SMALLINT
+);
+
+-- ORDER TABLES
+
+CREATE TABLE IF NOT EXISTS meal_order (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL,
+    amt NUMERIC(10, 2),
+    sent_to_eis TIMESTAMP,
+    customer_id INTEGER NOT NULL REFERENCES customer (id) ON DELETE CASCADE,
+    menu_id INTEGER NOT NULL REFERENCES menu (id) ON DELETE RESTRICT,
+    place_id SMALLINT REFERENCES delivery_place (id) ON DELETE RESTRICT
+);
+
+CREATE TABLE IF NOT EXISTS order_detail (
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    quantity SMALLINT NOT NULL,
+    order_id INTEGER NOT NULL REFERENCES meal_order (id) ON DELETE CASCADE,
+    menu_pos_id BIGINT NOT NULL REFERENCES menu_position (id) ON DELETE RESTRICT
+);
+
+-- HELP DESK TABLES
+
+CREATE TABLE IF NOT EXISTS hd_type (
+    id SMALLSERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS hd_request (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    phone_number VARCHAR(255),
+    user_name VARCHAR(255),
+    request_text TEXT NOT NULL,
+    solution_text TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    done_at TIMESTAMP,
+    type_id SMALLINT NOT NULL REFERENCES hd_type (id) ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS ix_hd_request_user_id ON hd_request (user_id);
+CREATE INDEX IF NOT EXISTS ix_hd_request_type_id ON hd_request (type_id);
@@ -0,0 +1,17 @@
+-- ORDER FLOW
+
+CREATE INDEX IF NOT EXISTS ix_meal_order_customer_menu ON meal_order (customer_id, menu_id);
+CREATE INDEX IF NOT EXISTS ix_meal_order_unsent ON meal_order (menu_id) WHERE sent_to_eis IS NULL;
+CREATE INDEX IF NOT EXISTS ix_order_detail_order_id ON order_detail (order_id);
+CREATE INDEX IF NOT EXISTS ix_menu_canteen_window ON menu (canteen_id, beg_time, end_time);
+CREATE INDEX IF NOT EXISTS ix_menu_position_menu_id ON menu_position (menu_id);
+
+-- AUTHORIZATION
+
+CREATE INDEX IF NOT EXISTS ix_customer_tg_id ON customer (tg_id) WHERE tg_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_customer_permission_customer_dates
+    ON customer_permission (customer_id, beg_date, end_date);
+
+-- HELP DESK
+
+CREATE INDEX IF NOT EXISTS ix_hd_request_open ON hd_request (id) WHERE done_at IS NULL;
@@ -0,0 +1,25 @@
+-- ONE ORDER PER CUSTOMER AND MENU
+
+-- Double taps used to create several orders for one customer and menu.
+-- Some of them may be exported to EIS already, so they are never deleted here:
+-- the migration stops and lists them to be resolved by hand.
+DO $$
+DECLARE
+    conflicts TEXT;
+BEGIN
+    SELECT string_agg(format('customer_id=%s menu_id=%s orders: %s', customer_id, menu_id, orders), E'\n')
+    INTO conflicts
+    FROM (
+        SELECT customer_id, menu_id,
+               string_agg(format('%s (sent_to_eis %s)', id, coalesce(sent_to_eis::TEXT, 'null')), ', ' ORDER BY id) AS orders
+        FROM meal_order
+        GROUP BY customer_id, menu_id
+        HAVING count(*) > 1
+    ) duplicates;
+    IF conflicts IS NOT NULL THEN
+        RAISE EXCEPTION E'Duplicate orders block uq_meal_order_customer_menu, keep one order per pair:\n%', conflicts;
+    END IF;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_meal_order_customer_menu ON meal_order (customer_id, menu_id);
+DROP INDEX IF EXISTS ix_meal_order_customer_menu;
@@ -0,0 +1,16 @@
+-- RESUMABLE BROADCASTS
+
+CREATE TABLE IF NOT EXISTS broadcast (
+    id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    admin_chat_id BIGINT NOT NULL,
+    progress_message_id INTEGER,
+    message_text TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    sent INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    last_tg_id BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_broadcast_unfinished ON broadcast (id) WHERE finished_at IS NULL;
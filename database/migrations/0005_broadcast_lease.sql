@@ -0,0 +1,4 @@
+-- BROADCAST OWNERSHIP BETWEEN WORKERS
+
+ALTER TABLE broadcast ADD COLUMN IF NOT EXISTS owner VARCHAR(64);
+ALTER TABLE broadcast ADD COLUMN IF NOT EXISTS lease_until TIMESTAMP;
@@ -1,7 +1,7 @@
 import datetime
 from decimal import Decimal
 from typing import List, Optional
-from sqlalchemy import ForeignKey, Identity, text
+from sqlalchemy import ForeignKey, Identity, Index, text
 from sqlalchemy.types import BigInteger, String, SmallInteger, Integer, Date, DateTime, Numeric, Boolean, Text
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -41,10 +41,14 @@ class DeliveryPlace(Base):
     )
     orders: Mapped[List['Order']] = relationship()
     customers: Mapped[List['Customer']] = relationship()
+    canteen: Mapped['Canteen'] = relationship(viewonly=True)
 
 
 class Customer(Base):
     __tablename__ = 'customer'
+    __table_args__ = (
+        Index('ix_customer_tg_id', 'tg_id', postgresql_where=text('tg_id IS NOT NULL')),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -63,6 +67,9 @@ class Customer(Base):
 
 class CustomerPermission(Base):
     __tablename__ = 'customer_permission'
+    __table_args__ = (
+        Index('ix_customer_permission_customer_dates', 'customer_id', 'beg_date', 'end_date'),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -93,6 +100,9 @@ class MealType(Base):
 
 class Menu(Base):
     __tablename__ = 'menu'
+    __table_args__ = (
+        Index('ix_menu_canteen_window', 'canteen_id', 'beg_time', 'end_time'),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -115,6 +125,9 @@ class Menu(Base):
 
 class MenuPosition(Base):
     __tablename__ = 'menu_position'
+    __table_args__ = (
+        Index('ix_menu_position_menu_id', 'menu_id'),
+    )
 
     id: Mapped[int] = mapped_column(
         BigInteger,
@@ -136,6 +149,10 @@ class MenuPosition(Base):
 
 class Order(Base):
     __tablename__ = 'meal_order'
+    __table_args__ = (
+        Index('uq_meal_order_customer_menu', 'customer_id', 'menu_id', unique=True),
+        Index('ix_meal_order_unsent', 'menu_id', postgresql_where=text('sent_to_eis IS NULL')),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -159,10 +176,15 @@ class Order(Base):
     )
 
     details: Mapped[List['OrderDetail']] = relationship(passive_deletes=True)
+    menu: Mapped['Menu'] = relationship(viewonly=True)
+    place: Mapped[Optional['DeliveryPlace']] = relationship(viewonly=True)
 
 
 class OrderDetail(Base):
     __tablename__ = 'order_detail'
+    __table_args__ = (
+        Index('ix_order_detail_order_id', 'order_id'),
+    )
 
     id: Mapped[int] = mapped_column(
         BigInteger,
@@ -177,6 +199,8 @@ class OrderDetail(Base):
         ForeignKey('menu_position.id', ondelete='RESTRICT')
     )
 
+    menu_position: Mapped['MenuPosition'] = relationship(viewonly=True)
+
 
 class HdType(Base):
     __tablename__ = 'hd_type'
@@ -189,6 +213,9 @@ class HdType(Base):
 
 class HdRequest(Base):
     __tablename__ = 'hd_request'
+    __table_args__ = (
+        Index('ix_hd_request_open', 'id', postgresql_where=text('done_at IS NULL')),
+    )
 
     id: Mapped[int] = mapped_column(Integer, Identity(always=True), primary_key=True)
     user_id: Mapped[int] = mapped_column(BigInteger, index=True)
@@ -204,3 +231,23 @@ class HdRequest(Base):
         ForeignKey(column='hd_type.id', ondelete='RESTRICT'),
         index=True
     )
+
+
+class Broadcast(Base):
+    __tablename__ = 'broadcast'
+    __table_args__ = (
+        Index('ix_broadcast_unfinished', 'id', postgresql_where=text('finished_at IS NULL')),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, Identity(always=True), primary_key=True)
+    admin_chat_id: Mapped[int] = mapped_column(BigInteger)
+    progress_message_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    message_text: Mapped[str] = mapped_column(Text)
+    total: Mapped[int] = mapped_column(Integer, server_default=text('0'))
+    sent: Mapped[int] = mapped_column(Integer, server_default=text('0'))
+    failed: Mapped[int] = mapped_column(Integer, server_default=text('0'))
+    last_tg_id: Mapped[int] = mapped_column(BigInteger, server_default=text('0'))
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, server_default=text('NOW()'))
+    finished_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
+    owner: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    lease_until: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,127 @@
+import datetime
+from typing import Any
+from sqlalchemy import select, delete, exists, text, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import BigInteger, SmallInteger
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import Order, OrderDetail, DeliveryPlace, Menu
+
+
+class OrderRepository:
+    model = Order
+
+    @classmethod
+    def _order_options(cls):
+        return (
+            joinedload(cls.model.menu),
+            joinedload(cls.model.place).joinedload(DeliveryPlace.canteen),
+            selectinload(cls.model.details).joinedload(OrderDetail.menu_position)
+        )
+
+    @classmethod
+    async def get_customer_orders(cls, session: AsyncSession, customer_id: int):
+        query = (
+            select(cls.model)
+            .where(cls.model.customer_id == customer_id)
+            .options(*cls._order_options())
+            .order_by(cls.model.id)
+        )
+        result = await session.execute(query)
+        return result.unique().scalars().all()
+
+    @classmethod
+    async def get_customer_order_ids(cls, session: AsyncSession, customer_id: int, active_only: bool = False):
+        query = select(cls.model.id).where(cls.model.customer_id == customer_id).order_by(cls.model.id)
+        if active_only:
+            query = (
+                query
+                .join(cls.model.menu)
+                .where(cls.model.sent_to_eis.is_(None))
+                .where(Menu.end_time >= datetime.datetime.now())
+            )
+        result = await session.execute(query)
+        return result.scalars().all()
+
+    @classmethod
+    async def get_order(cls, session: AsyncSession, order_id: int):
+        query = select(cls.model).where(cls.model.id == order_id).options(*cls._order_options())
+        result = await session.execute(query)
+        return result.unique().scalar_one_or_none()
+
+    @classmethod
+    async def get_ordered_menu_ids(cls, session: AsyncSession, customer_id: int, menu_ids: list[int]):
+        query = (
+            select(cls.model.menu_id)
+            .where(cls.model.customer_id == customer_id)
+            .where(cls.model.menu_id.in_(menu_ids))
+        )
+        result = await session.execute(query)
+        return set(result.scalars().all())
+
+    @classmethod
+    async def create_order(
+            cls, session: AsyncSession, order_data: dict[str, Any], details: list[tuple[int, int]]):
+        query = text(
+            '''
+            WITH new_order AS (
+                INSERT INTO meal_order (created_at, amt, customer_id, menu_id, place_id)
+                SELECT CAST(:created_at AS TIMESTAMP), CAST(:amt AS NUMERIC(10, 2)), CAST(:customer_id AS INTEGER),
+                       CAST(:menu_id AS INTEGER), CAST(:place_id AS SMALLINT)
+                WHERE EXISTS (select null from menu m
+                              where m.id = :menu_id
+                                and m.end_time >= :created_at)
+                  AND EXISTS (select null from customer_permission p
+                              where p.customer_id = :customer_id
+                                and p.beg_date <= CAST(:created_at AS DATE)
+                                and coalesce(p.end_date, CAST(:created_at AS DATE)) >= CAST(:created_at AS DATE))
+                ON CONFLICT (customer_id, menu_id) DO NOTHING
+                RETURNING id
+            ),
+            new_details AS (
+                INSERT INTO order_detail (order_id, menu_pos_id, quantity)
+                SELECT o.id, d.menu_pos_id, d.quantity
+                FROM new_order o,
+                     unnest(CAST(:menu_pos_ids AS BIGINT[]), CAST(:quantities AS SMALLINT[])) AS d(menu_pos_id, quantity)
+                RETURNING order_id
+            )
+            SELECT (select id from new_order) AS order_id,
+                   (select count(*) from new_details) AS details
+            '''
+        ).bindparams(
+            bindparam('menu_pos_ids', type_=ARRAY(BigInteger)),
+            bindparam('quantities', type_=ARRAY(SmallInteger))
+        )
+        result = await session.execute(
+            query,
+            {
+                **order_data,
+                'menu_pos_ids': [menu_pos_id for menu_pos_id, _ in details],
+                'quantities': [quantity for _, quantity in details]
+            }
+        )
+        created = dict(result.mappings().one())
+        # a concurrent insert is invisible to the statement snapshot, so look for it in a new one
+        created['conflict'] = created['order_id'] is None and bool(await session.scalar(
+            select(
+                exists()
+                .where(cls.model.customer_id == order_data['customer_id'])
+                .where(cls.model.menu_id == order_data['menu_id'])
+            )
+        ))
+        await session.commit()
+        return created
+
+    @classmethod
+    async def cancel_order(cls, session: AsyncSession, order_id: int, customer_id: int) -> int | None:
+        query = (
+            delete(cls.model)
+            .where(cls.model.id == order_id)
+            .where(cls.model.customer_id == customer_id)
+            .where(cls.model.sent_to_eis.is_(None))
+            .where(cls.model.menu_id == Menu.id, Menu.end_time >= datetime.datetime.now())
+            .returning(cls.model.id)
+        )
+        result = await session.execute(query)
+        await session.commit()
+        return result.scalar_one_or_none()
@@ -0,0 +1,80 @@
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+if TYPE_CHECKING:
+    from config.config import DatabaseConfig
+
+
+@dataclass
+class PoolMetrics:
+    size: int = field(default=0)
+    checked_out: int = field(default=0)
+    overflow: int = field(default=0)
+    waits: int = field(default=0)
+    wait_time: float = field(default=0)
+    max_wait_time: float = field(default=0)
+    timeouts: int = field(default=0)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._timeouts = 0
+
+    def _do_get(self):
+        if self._max_overflow == -1 or self.checkedin() or self.overflow() < self._max_overflow:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self._waits += 1
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool._waits, pool._wait_time = self._waits, self._wait_time
+        pool._max_wait_time, pool._timeouts = self._max_wait_time, self._timeouts
+        return pool
+
+    def metrics(self) -> PoolMetrics:
+        return PoolMetrics(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            waits=self._waits,
+            wait_time=self._wait_time,
+            max_wait_time=self._max_wait_time,
+            timeouts=self._timeouts
+        )
+
+
+def create_engine(db: 'DatabaseConfig') -> AsyncEngine:
+    return create_async_engine(url=db.url, poolclass=InstrumentedQueuePool, **db.engine_options)
+
+
+def create_replica_engines(db: 'DatabaseConfig') -> list[AsyncEngine]:
+    return [
+        create_async_engine(url=url, poolclass=InstrumentedQueuePool, **db.engine_options)
+        .execution_options(postgresql_readonly=True)
+        for url in db.replica_urls
+    ]
+
+
+def pool_metrics(engine: AsyncEngine) -> PoolMetrics | None:
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.metrics()
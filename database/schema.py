@@ -0,0 +1,23 @@
+import logging
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from database.models import Base
+
+logger = logging.getLogger(__name__)
+
+
+def expected_indexes() -> set[str]:
+    return {index.name for table in Base.metadata.tables.values() for index in table.indexes}
+
+
+async def missing_indexes(engine: AsyncEngine) -> set[str]:
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"))
+        return expected_indexes() - set(result.scalars().all())
+
+
+async def check_indexes(engine: AsyncEngine) -> bool:
+    missing = await missing_indexes(engine)
+    if missing:
+        logger.error('Missing database indexes: %s. Run "python -m database.migrate"', ', '.join(sorted(missing)))
+    return not missing
@@ -1,5 +1,7 @@
 from .order_exceptions import (InvalidPositionQuantity, InvalidOrderMenu, ValidMenusNotExist,
                                ValidCanteensNotExist, OrdersNotExist, NoPositionsSelected,
-                               InvalidOrder, EmptyException)
+                               InvalidOrder, OrderAlreadyExists, EmptyException)
 from .user_exceptions import IsNotCustomer, IsNotAuthorize
 from .hd_exceptions import RequestsNotExists
+from .db_exceptions import MigrationError
+from .storage_exceptions import StateTooLarge
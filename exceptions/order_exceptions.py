@@ -26,5 +26,9 @@ class InvalidOrder(Exception):
     pass
 
 
+class OrderAlreadyExists(InvalidOrder):
+    pass
+
+
 class EmptyException(Exception):
     pass
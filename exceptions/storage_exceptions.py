@@ -0,0 +1,2 @@
+class StateTooLarge(Exception):
+    pass
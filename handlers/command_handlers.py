@@ -9,7 +9,7 @@ from keyboards.reply import initial_kb, authorization_kb
 from keyboards.inline import help_chapters_kb
 from presentation.command_views import switch_start_cancel_view
 from states.user_states import AuthState
-from services.functions import is_auth
+from services.auth import AuthService
 from services.other_services import terminate_state_branch
 from presentation import help_info
 
@@ -18,8 +18,8 @@ router = Router()
 
 
 @router.message(CommandStart(), StateFilter(default_state))
-async def process_start_command(message: Message, state: FSMContext, session: AsyncSession):
-    await process_switch_base_keyboards(message, state, session)
+async def process_start_command(message: Message, state: FSMContext, read_session: AsyncSession):
+    await process_switch_base_keyboards(message, state, read_session)
 
 
 @router.message(CommandStart(), ~StateFilter(default_state))
@@ -50,9 +50,9 @@ async def process_auth_help(callback: CallbackQuery):
 
 
 @router.message(Command('cancel'), ~StateFilter(default_state))
-async def process_cancel_with_context(message: Message, session: AsyncSession, state: FSMContext):
+async def process_cancel_with_context(message: Message, read_session: AsyncSession, state: FSMContext):
     await terminate_state_branch(message, state, add_last=False)
-    await process_switch_base_keyboards(message, state, session)
+    await process_switch_base_keyboards(message, state, read_session)
 
 
 @router.message(Command('cancel'), StateFilter(default_state))
@@ -66,7 +66,7 @@ async def process_cancel_without_context(message: Message):
 
 async def process_switch_base_keyboards(
         message: Message, state: FSMContext, session: AsyncSession):
-    if not await is_auth(session, message.from_user.id):
+    if not await AuthService.is_auth(session, message.from_user.id):
         await state.set_state(AuthState.get_contact)
         text = switch_start_cancel_view(message.text, False)
         reply_markup = authorization_kb()
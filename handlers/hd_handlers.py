@@ -9,6 +9,7 @@ from keyboards.inline import show_hd_types_kb, confirm_request_kb, scroll_reques
 from states.hd_states import HdState, AdminState, AdminResponseState, AdminMessageState
 from states.user_states import AuthState
 from services.hd import HDService
+from services.broadcast import Broadcaster
 from services.other_services import terminate_state_branch
 from presentation.responses import message_response, callback_response, edit_response
 from presentation.hd_views import show_request_info
@@ -43,8 +44,8 @@ async def process_cancel_support(message: Message):
 
 
 @router.message(StateFilter(HdState.initial), F.text.endswith('Задать вопрос администратору'))
-async def process_show_hd_types(message: Message, state: FSMContext, session: AsyncSession):
-    types = await HDService.get_hd_types(session)
+async def process_show_hd_types(message: Message, state: FSMContext, read_session: AsyncSession):
+    types = await HDService.get_hd_types(read_session)
     await message_response(
         message=message,
         text='Выберите из списка тему вопроса:',
@@ -124,9 +125,9 @@ async def process_cancel_request(callback: CallbackQuery, state: FSMContext):
 
 
 @router.message(StateFilter(HdState.initial), F.text.endswith('Мои вопросы-ответы'))
-async def process_show_user_requests(message: Message, state: FSMContext, session: AsyncSession):
+async def process_show_user_requests(message: Message, state: FSMContext, read_session: AsyncSession):
     try:
-        requests = await HDService.get_user_requests(session, message.from_user.id)
+        current_request = await HDService.get_request(read_session, user_id=message.from_user.id)
     except RequestsNotExists:
         await message_response(
             message=message,
@@ -136,8 +137,7 @@ async def process_show_user_requests(message: Message, state: FSMContext, sessio
             delete_after=True
         )
     else:
-        await HDService.remember_variables(state, requests=requests)
-        current_request = tuple(requests.items())[0][-1]
+        await HDService.remember_variables(state, browse={'user_id': message.from_user.id})
         await message_response(
             message=message,
             text=show_request_info(current_request),
@@ -150,8 +150,12 @@ async def process_show_user_requests(message: Message, state: FSMContext, sessio
 
 @router.callback_query(StateFilter(HdState.show_requests), F.data.startswith('scroll'))
 @router.callback_query(StateFilter(AdminResponseState.show_user_requests), F.data.startswith('scroll'))
-async def process_scroll_requests(callback: CallbackQuery, state: FSMContext):
-    request = await HDService.get_request_from_cache(state, int(callback.data.split(':')[1]))
+async def process_scroll_requests(callback: CallbackQuery, state: FSMContext, read_session: AsyncSession):
+    try:
+        request = await HDService.get_request_from_browse(read_session, state, int(callback.data.split(':')[1]))
+    except RequestsNotExists:
+        await callback.answer(text='Запрос не найден')
+        return
     if not request.id == request.prev_id == request.next_id:
         await edit_response(
             message=callback.message,
@@ -176,9 +180,9 @@ async def process_back_to_initial(callback: CallbackQuery, state: FSMContext):
 
 
 @router.message(StateFilter(HdState.initial), F.text.endswith('Вернуться к заказу питания'))
-async def process_return_to_main_menu(message: Message, state: FSMContext, session: AsyncSession):
+async def process_return_to_main_menu(message: Message, state: FSMContext, read_session: AsyncSession):
     await terminate_state_branch(message, state)
-    is_auth = await HDService.is_auth_user(session, message.from_user.id)
+    is_auth = await HDService.is_auth_user(read_session, message.from_user.id)
     await message_response(
         message=message,
         text='Возврат в главное меню',
@@ -225,9 +229,9 @@ async def process_return_to_hd_menu(message: Message, state: FSMContext):
 
 
 @router.callback_query(StateFilter(AdminResponseState.group_choice))
-async def process_show_requests(callback: CallbackQuery, state: FSMContext, session: AsyncSession):
+async def process_show_requests(callback: CallbackQuery, state: FSMContext, read_session: AsyncSession):
     try:
-        requests = await HDService.get_requests_by_admin(session, mode=callback.data)
+        current_request = await HDService.get_request(read_session, mode=callback.data)
     except RequestsNotExists:
         await message_response(
             message=callback.message,
@@ -238,9 +242,7 @@ async def process_show_requests(callback: CallbackQuery, state: FSMContext, sess
         )
         await state.set_state(AdminState.initial)
     else:
-        await HDService.remember_variables(state, requests=requests)
-        current_request = tuple(requests.items())[0][-1]
-        print(current_request.user_id)
+        await HDService.remember_variables(state, browse={'mode': callback.data})
         await message_response(
             message=callback.message,
             text=show_request_info(current_request, True),
@@ -360,16 +362,16 @@ async def process_set_message(message: Message, state: FSMContext):
 
 
 @router.callback_query(StateFilter(AdminMessageState.confirm_send), F.data == 'confirm')
-async def process_send_message(callback: CallbackQuery, state: FSMContext, session: AsyncSession):
+async def process_send_message(callback: CallbackQuery, state: FSMContext, broadcaster: Broadcaster):
     data = await state.get_data()
     await HDService.send_message_to_bot_users(
-        bot=callback.bot,
-        msg_text=data['admin_msg_text'],
-        session=session
+        broadcaster=broadcaster,
+        admin_chat_id=callback.message.chat.id,
+        msg_text=data['admin_msg_text']
     )
     await callback_response(
         callback=callback,
-        text='Сообщение отправлено пользователям бота',
+        text='Рассылка запущена. Ход рассылки будет отображаться в отдельном сообщении',
         show_alert=True
     )
     await terminate_state_branch(callback.message, state)
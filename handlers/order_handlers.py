@@ -4,14 +4,14 @@ from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import default_state
 from sqlalchemy.ext.asyncio import AsyncSession
-from keyboards.inline import (order_menu_kb, dish_count_kb_new, inline_confirm_cancel_kb,
+from keyboards.inline import (order_menu_kb, menu_page_kb, inline_confirm_cancel_kb,
                               order_delete_scroll_kb, order_view_scroll_kb)
 from keyboards.reply import confirm_cancel_kb, back_to_initial_kb, initial_kb
 from states.order_states import NewOrderState, CancelOrderState, OrdersViewState
 from services.other_services import terminate_state_branch
 from exceptions import (InvalidPositionQuantity, ValidMenusNotExist, IsNotCustomer,
-                        OrdersNotExist, NoPositionsSelected, InvalidOrder, EmptyException)
-from presentation.order_views import position_view_new, order_view
+                        OrdersNotExist, NoPositionsSelected, InvalidOrder, OrderAlreadyExists)
+from presentation.order_views import menu_page_view, order_view
 from presentation.responses import message_response, callback_response, edit_response
 from middlewares import ServiceManagerMiddleware
 from services.managers import OrderManager
@@ -23,12 +23,12 @@ router.callback_query.middleware(ServiceManagerMiddleware(OrderManager))
 
 @router.message(F.text.endswith('Новый заказ'), StateFilter(default_state))
 async def process_new_order(
-        message: Message, session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
+        message: Message, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
     text = 'Произошла ошибка при инициализации нового заказа.'
     reply_markup = None
     try:
-        await manager.start_process_new_order(session, state, message)
-        valid_menus = await manager.receive_valid_menus(session, state)
+        await manager.start_process_new_order(read_session, state, message)
+        valid_menus = await manager.receive_valid_menus(read_session, state)
         await state.set_state(NewOrderState.menu_choice)
         text = 'Выберите меню для заказа:'
         reply_markup = order_menu_kb(valid_menus)
@@ -61,14 +61,19 @@ async def process_menu_button_with_context(message: Message) -> None:
 
 @router.callback_query(StateFilter(NewOrderState.menu_choice))
 async def new_order_positions(
-        callback: CallbackQuery, session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
-    positions = await manager.receive_menu_positions(session, callback, state)
-    await process_positions_response(callback.message, state, positions)
+        callback: CallbackQuery, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
+    menu_page = await manager.receive_menu_positions(read_session, callback, state)
+    await message_response(
+        message=callback.message,
+        text=menu_page_view(menu_page),
+        reply_markup=menu_page_kb(menu_page),
+        state=state
+    )
     await state.set_state(NewOrderState.dish_choice)
     await message_response(
         message=callback.message,
-        text='После добавления блюд нажмите <b><i>Подтвердить</i></b>, чтобы сохранить заказ. '
-             'Для продолжения вывода позиций меню нажмите на кнопку <b><i>Продолжить список</i></b>.'
+        text='Выберите количество блюд кнопками ➖ и ➕, для перехода между страницами меню используйте ⏪ и ⏩. '
+             'После добавления блюд нажмите <b><i>Подтвердить</i></b>, чтобы сохранить заказ. '
              'Для отмены заказа нажмите <b><i>Отменить</i></b>.',
         reply_markup=confirm_cancel_kb(),
         state=state
@@ -78,9 +83,9 @@ async def new_order_positions(
 
 @router.message(StateFilter(NewOrderState.dish_choice), F.text.endswith('Заказать стандартный комплекс'))
 async def process_standard_complex(
-        message: Message, session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
+        message: Message, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
     try:
-        order = await manager.receive_complex_order(session, state)
+        order = await manager.receive_complex_order(read_session, state)
         await state.set_state(NewOrderState.check_status)
         await process_new_order_info_response(message, state, order)
     except NoPositionsSelected:
@@ -91,53 +96,40 @@ async def process_standard_complex(
         )
 
 
-@router.message(StateFilter(NewOrderState.dish_choice), F.text.endswith('Продолжить список'))
-async def process_continue_positions(message: Message, state: FSMContext, manager: OrderManager) -> None:
-    try:
-        positions = await manager.continue_receiving_positions(state)
-        await process_positions_response(message, state, positions)
-    except EmptyException:
-        await message_response(
-            message=message,
-            text='Все доступные позиции выведены.',
-            state=state
-        )
+@router.callback_query(StateFilter(NewOrderState.dish_choice), F.data.startswith('page'))
+async def turn_menu_page(
+        callback: CallbackQuery, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
+    menu_page = await manager.turn_menu_page(read_session, callback, state)
+    await edit_response(
+        message=callback.message,
+        text=menu_page_view(menu_page),
+        reply_markup=menu_page_kb(menu_page)
+    )
+    await callback_response(callback)
 
 
 @router.callback_query(StateFilter(NewOrderState.dish_choice), F.data.startswith('minus') | F.data.startswith('plus'))
 async def change_quantity_of_position(
-        callback: CallbackQuery, state: FSMContext, manager: OrderManager) -> None:
+        callback: CallbackQuery, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
     text = None
     try:
-        position = await manager.increment_position_quantity(callback, state)
+        menu_page = await manager.change_position_quantity(read_session, callback, state)
         await edit_response(
             message=callback.message,
-            text=position_view_new(position),
-            reply_markup=dish_count_kb_new(position)
+            text=menu_page_view(menu_page),
+            reply_markup=menu_page_kb(menu_page)
         )
     except InvalidPositionQuantity:
-        text = 'Количество не может быть меньше 1'
+        text = 'Позиция еще не добавлена в заказ'
     finally:
         await callback_response(callback, text=text)
 
 
-@router.callback_query(StateFilter(NewOrderState.dish_choice), F.data.startswith('add'))
-async def add_new_position_to_order(
-        callback: CallbackQuery, state: FSMContext, manager: OrderManager) -> None:
-    await manager.add_position_to_order(callback, state)
-    await callback_response(
-        callback=callback,
-        text='Позиция успешно добавлена',
-        show_alert=True,
-        delete_after=True
-    )
-
-
 @router.message(StateFilter(NewOrderState.dish_choice), F.text.endswith('Подтвердить'))
 async def process_order_info(
-        message: Message, state: FSMContext, manager: OrderManager) -> None:
+        message: Message, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
     try:
-        order = manager.receive_full_order()
+        order = await manager.receive_full_order(read_session)
         await state.set_state(NewOrderState.check_status)
         await process_new_order_info_response(message, state, order)
     except NoPositionsSelected:
@@ -168,6 +160,8 @@ async def process_pending_new_order(
     try:
         await manager.confirm_pending_order(session)
         text = 'Ваш заказ отправлен'
+    except OrderAlreadyExists:
+        text = 'Заказ на это меню уже отправлен.'
     except InvalidOrder:
         text = 'Заказ не может быть отправлен.'
     finally:
@@ -201,10 +195,10 @@ async def process_cancel_new_order(callback: CallbackQuery, state: FSMContext) -
 
 @router.message(StateFilter(default_state), F.text.endswith('Просмотр заказов'))
 async def process_orders_history(
-        message: Message, session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
+        message: Message, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
     await process_view_orders(
         message=message,
-        session=session,
+        session=read_session,
         state=state,
         manager=manager,
         no_orders_text='У вас пока нет заказов.',
@@ -215,10 +209,10 @@ async def process_orders_history(
 
 @router.message(StateFilter(default_state), F.text.endswith('Удаление активных заказов'))
 async def process_delete_order(
-        message: Message, session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
+        message: Message, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
     await process_view_orders(
         message=message,
-        session=session,
+        session=read_session,
         state=state,
         manager=manager,
         no_orders_text='У вас нет активных заказов.',
@@ -233,16 +227,15 @@ async def process_delete_order(
 @router.callback_query(
     StateFilter(CancelOrderState.order_choices), F.data.startswith('prev') | F.data.startswith('next'))
 async def process_listing_orders(
-        callback: CallbackQuery, state: FSMContext, manager: OrderManager) -> None:
+        callback: CallbackQuery, read_session: AsyncSession, state: FSMContext, manager: OrderManager) -> None:
     await manager.process_scroll(callback, state)
-    await edit_order_response(callback, state, manager)
+    await edit_order_response(callback, read_session, state, manager)
 
 
 @router.callback_query(StateFilter(CancelOrderState.order_choices), F.data.startswith('delete'))
 async def process_delete_order(
         callback: CallbackQuery, session: AsyncSession, manager: OrderManager, state: FSMContext) -> None:
-    if order := await manager.valid_order_to_delete(state):
-        await manager.cancel_order(session, order)
+    if await manager.cancel_current_order(session, state):
         text = 'Заказ успешно удален'
     else:
         text = 'Заказ не может быть удален'
@@ -251,16 +244,9 @@ async def process_delete_order(
         text=text,
         show_alert=True,
     )
-    try:
-        await edit_order_response(callback, state, manager)
-    except EmptyException:
-        await message_response(
-            message=callback.message,
-            text='Все заказы удалены. Возврат в главное меню.',
-            reply_markup=initial_kb(),
-            delete_after=True
-        )
-        await terminate_state_branch(callback.message, state, add_last=False)
+    await edit_order_response(
+        callback, session, state, manager, no_orders_text='Все заказы удалены. Возврат в главное меню.'
+    )
 
 
 @router.message(StateFilter(OrdersViewState.order_views), F.text.endswith('Вернуться в главное меню'))
@@ -274,7 +260,23 @@ async def process_back_to_main_menu(message: Message, state: FSMContext) -> None
     await terminate_state_branch(message, state)
 
 
-async def edit_order_response(callback: CallbackQuery, state: FSMContext, manager: OrderManager) -> None:
+async def edit_order_response(
+        callback: CallbackQuery,
+        session: AsyncSession,
+        state: FSMContext,
+        manager: OrderManager,
+        no_orders_text: str = 'Заказов больше нет. Возврат в главное меню.') -> None:
+    try:
+        order = await manager.current_order(session, state)
+    except OrdersNotExist:
+        await message_response(
+            message=callback.message,
+            text=no_orders_text,
+            reply_markup=initial_kb(),
+            delete_after=True
+        )
+        await terminate_state_branch(callback.message, state, add_last=False)
+        return
     markup = None
     current_state = await state.get_state()
     match current_state:
@@ -284,7 +286,7 @@ async def edit_order_response(callback: CallbackQuery, state: FSMContext, manage
             markup = order_delete_scroll_kb(manager.current_order_position())
     await edit_response(
         message=callback.message,
-        text=order_view(manager.current_order()),
+        text=order_view(order),
         reply_markup=markup
     )
 
@@ -304,17 +306,6 @@ async def process_new_order_info_response(message: Message, state: FSMContext, o
     )
 
 
-async def process_positions_response(message: Message, state: FSMContext, positions) -> None:
-    for position in positions:
-        await message_response(
-            message=message,
-            text=position_view_new(position),
-            reply_markup=dish_count_kb_new(position),
-            state=state,
-            delay=0.1
-        )
-
-
 async def process_view_orders(
         message: Message,
         session: AsyncSession,
@@ -330,10 +321,11 @@ async def process_view_orders(
     in_state = False
     try:
         await manager.receive_customer_orders(session, message, state, valid=valid_orders)
+        order = await manager.current_order(session, state)
         await state.set_state(new_state)
         await message_response(
             message=message,
-            text=order_view(manager.current_order()),
+            text=order_view(order),
             reply_markup=markup_func(manager.current_order_position()),
             state=state
         )
@@ -11,7 +11,7 @@ from services.other_services import (terminate_state_branch, set_track_callback,
                                      update_track_callback, get_track_callback)
 from middlewares import ServiceManagerMiddleware
 from services.managers import UserManager
-from presentation.responses import message_response, callback_response, edit_response
+from presentation.responses import message_response, callback_response, edit_tracked_response
 from presentation.user_views import old_place_view
 from exceptions import IsNotCustomer, ValidCanteensNotExist
 
@@ -73,8 +73,9 @@ async def process_set_place_auth(
     else:
         track_cb = await get_track_callback(state)
         if track_cb.callback_data != callback.data:
-            await edit_response(
-                message=track_cb.message,
+            await edit_tracked_response(
+                bot=callback.bot,
+                track_cb=track_cb,
                 text=message_text,
                 reply_markup=markup
             )
@@ -180,7 +181,7 @@ async def process_choice_canteens_places(
         else:
             await state.set_state(place_state)
             text = 'Выберите место доставки:'
-            reply_markup = show_places_kb_new(await manager.receive_canteen_places(canteen=canteens[0]))
+            reply_markup = show_places_kb_new(await manager.receive_canteen_places(session, canteen=canteens[0]))
 
     except (IsNotCustomer, ValidCanteensNotExist) as exc:
         await state.clear()
@@ -223,8 +224,9 @@ async def process_choice_delivery_place(
     else:
         track_cb = await get_track_callback(state)
         if track_cb.callback_data != callback.data:
-            await edit_response(
-                message=track_cb.message,
+            await edit_tracked_response(
+                bot=callback.bot,
+                track_cb=track_cb,
                 text=message_text,
                 reply_markup=markup
             )
@@ -1,14 +1,13 @@
 from typing import List
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from database.models import Canteen, Menu, DeliveryPlace
 from keyboards.callbacks import (CanteenCallbackFactory, PlaceCallbackFactory,
                                  MenuCallbackFactory, HDTypeCallbackFactory)
-from services.models import DetailForm, DataPosition
-from services.models import SHDType, SCurrentHDRequest
+from services.models import MenuPage, DataPosition
+from services.models import SHDType, SCurrentHDRequest, SCanteen, SDeliveryPlace, SMenuSlot
 
 
-def show_canteens_kb(canteens: list[Canteen]) -> InlineKeyboardMarkup:
+def show_canteens_kb(canteens: list[SCanteen]) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     for canteen in canteens:
         builder.button(
@@ -20,7 +19,7 @@ def show_canteens_kb(canteens: list[Canteen]) -> InlineKeyboardMarkup:
     return builder.adjust(2).as_markup()
 
 
-def show_places_kb_new(places: list[DeliveryPlace]) -> InlineKeyboardMarkup:
+def show_places_kb_new(places: list[SDeliveryPlace]) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     for place in places:
         builder.button(
@@ -32,7 +31,7 @@ def show_places_kb_new(places: list[DeliveryPlace]) -> InlineKeyboardMarkup:
     return builder.adjust(1).as_markup()
 
 
-def order_menu_kb(menus: list[Menu]) -> InlineKeyboardMarkup:
+def order_menu_kb(menus: list[SMenuSlot]) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     for menu in menus:
         builder.button(
@@ -44,21 +43,40 @@ def order_menu_kb(menus: list[Menu]) -> InlineKeyboardMarkup:
     return builder.adjust(1).as_markup()
 
 
-def dish_count_kb_new(detail_form: DetailForm) -> InlineKeyboardMarkup:
-    keyboard = [[
-        InlineKeyboardButton(
-            text='➖1️⃣',
-            callback_data=f'minus:{detail_form.menu_pos_id}'
-        ),
-        InlineKeyboardButton(
-            text='✔ Добавить',
-            callback_data=f'add:{detail_form.menu_pos_id}'
-        ),
-        InlineKeyboardButton(
-            text='➕1️⃣',
-            callback_data=f'plus:{detail_form.menu_pos_id}'
+def menu_page_kb(menu_page: MenuPage) -> InlineKeyboardMarkup:
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                text='➖',
+                callback_data=f'minus:{position.id}'
+            ),
+            InlineKeyboardButton(
+                text=f'№{num}: {menu_page.quantities.get(position.id, 0)}',
+                callback_data='no action'
+            ),
+            InlineKeyboardButton(
+                text='➕',
+                callback_data=f'plus:{position.id}'
+            )
+        ] for num, position in enumerate(menu_page.positions, start=menu_page.offset + 1)
+    ]
+    if menu_page.count > 1:
+        keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text='⏪',
+                    callback_data=f'page:{menu_page.number - 1}'
+                ),
+                InlineKeyboardButton(
+                    text=f'📃 {menu_page.number + 1}/{menu_page.count}',
+                    callback_data='no action'
+                ),
+                InlineKeyboardButton(
+                    text='⏩',
+                    callback_data=f'page:{menu_page.number + 1}'
+                )
+            ]
         )
-    ]]
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
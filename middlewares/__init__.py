@@ -1,2 +1,3 @@
-from .global_middlewares import DbSessionMiddleware
+from .global_middlewares import DbSessionMiddleware, SessionStats, BufferedStateMiddleware, StateStats
 from .local_middlewares import ServiceManagerMiddleware
+from .request_middlewares import ThrottlingRequestMiddleware
@@ -1,13 +1,169 @@
+import time
+from dataclasses import dataclass, field
+from itertools import cycle
 from typing import Callable, Awaitable, Dict, Any
 from aiogram import BaseMiddleware
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import StateType
 from aiogram.types import TelegramObject
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+READ_YOUR_WRITES_WINDOW = 30
+
+
+@dataclass
+class SessionStats:
+    updates: int = field(default=0)
+    sessions: int = field(default=0)
+    replica_sessions: int = field(default=0)
+
+
+@dataclass
+class StateStats:
+    reads: int = field(default=0)
+    writes: int = field(default=0)
+    reads_saved: int = field(default=0)
+    writes_saved: int = field(default=0)
+
+
+class BufferedFSMContext(FSMContext):
+
+    def __init__(self, context: FSMContext, stats: StateStats, raw_state: str | None = None):
+        super().__init__(storage=context.storage, key=context.key)
+        self._stats = stats
+        self._state = raw_state
+        self._data: dict[str, Any] | None = None
+        self._state_changes = 0
+        self._data_changes = 0
+
+    async def set_state(self, state: StateType = None) -> None:
+        self._state = state.state if isinstance(state, State) else state
+        self._state_changes += 1
+
+    async def get_state(self) -> str | None:
+        self._stats.reads_saved += 1
+        return self._state
+
+    async def set_data(self, data: dict[str, Any]) -> None:
+        self._data = data.copy()
+        self._data_changes += 1
+
+    async def get_data(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = await self.storage.get_data(key=self.key)
+            self._stats.reads += 1
+        else:
+            self._stats.reads_saved += 1
+        return self._data.copy()
+
+    async def update_data(self, data: dict[str, Any] | None = None, **kwargs: Any) -> dict[str, Any]:
+        if data:
+            kwargs.update(data)
+        current_data = await self.get_data()
+        current_data.update(kwargs)
+        await self.set_data(current_data)
+        return current_data.copy()
+
+    async def flush(self) -> None:
+        if self._state_changes:
+            await self.storage.set_state(key=self.key, state=self._state)
+            self._stats.writes += 1
+            self._stats.writes_saved += self._state_changes - 1
+        if self._data_changes:
+            await self.storage.set_data(key=self.key, data=self._data)
+            self._stats.writes += 1
+            self._stats.writes_saved += self._data_changes - 1
+        self._state_changes = self._data_changes = 0
+
+
+class BufferedStateMiddleware(BaseMiddleware):
+    def __init__(self, stats: StateStats | None = None):
+        super().__init__()
+        self.stats = stats or StateStats()
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any],
+    ) -> Any:
+        context: FSMContext | None = data.get('state')
+        if context is None:
+            return await handler(event, data)
+        state = BufferedFSMContext(context, self.stats, data.get('raw_state'))
+        data['state'] = state
+        try:
+            return await handler(event, data)
+        finally:
+            await state.flush()
+
+
+class LazySession:
+
+    def __init__(self, session_pool: async_sessionmaker, on_create: Callable[[], None]):
+        self._session_pool = session_pool
+        self._on_create = on_create
+        self._session: AsyncSession | None = None
+        self.committed = False
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_pool()
+            self._on_create()
+        return self._session
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.session, item)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        self.committed = True
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+class ReadYourWrites:
+    key = 'last_write_at'
+
+    def __init__(self, window: float = READ_YOUR_WRITES_WINDOW):
+        self._window = window
+
+    async def mark_write(self, state: FSMContext) -> None:
+        await state.update_data({self.key: time.time()})
+
+    async def needs_primary(self, state: FSMContext) -> bool:
+        data = await state.get_data()
+        last_write = data.get(self.key)
+        if last_write is None:
+            return False
+        if time.time() - last_write < self._window:
+            return True
+        del data[self.key]
+        await state.set_data(data)
+        return False
 
 
 class DbSessionMiddleware(BaseMiddleware):
-    def __init__(self, session_pool: async_sessionmaker):
+    def __init__(
+            self,
+            session_pool: async_sessionmaker,
+            stats: SessionStats | None = None,
+            replica_pools: list[async_sessionmaker] | None = None):
         super().__init__()
         self.session_pool = session_pool
+        self.stats = stats or SessionStats()
+        self.replica_pools = cycle(replica_pools) if replica_pools else None
+        self.read_your_writes = ReadYourWrites()
+
+    def _count_session(self) -> None:
+        self.stats.sessions += 1
+
+    def _count_replica_session(self) -> None:
+        self.stats.replica_sessions += 1
 
     async def __call__(
             self,
@@ -15,6 +171,19 @@ class DbSessionMiddleware(BaseMiddleware):
             event: TelegramObject,
             data: Dict[str, Any],
     ) -> Any:
-        async with self.session_pool() as session:
+        self.stats.updates += 1
+        state: FSMContext | None = data.get('state')
+        session = LazySession(self.session_pool, self._count_session)
+        read_session = session
+        if self.replica_pools and not (state and await self.read_your_writes.needs_primary(state)):
+            read_session = LazySession(next(self.replica_pools), self._count_replica_session)
+        try:
             data["session"] = session
+            data["read_session"] = read_session
             return await handler(event, data)
+        finally:
+            if self.replica_pools and state and session.committed:
+                await self.read_your_writes.mark_write(state)
+            await session.close()
+            if read_session is not session:
+                await read_session.close()
@@ -17,7 +17,5 @@ class ServiceManagerMiddleware(BaseMiddleware):
     ) -> Any:
         state: FSMContext = data['state']
         state_data = await state.get_data()
-        if self.service_manager.__name__ not in state_data:
-            state_data[self.service_manager.__name__] = self.service_manager()
-        data['manager'] = state_data.get(self.service_manager.__name__)
+        data['manager'] = self.service_manager.load(state_data.get(self.service_manager.__name__))
         return await handler(event, data)
@@ -0,0 +1,49 @@
+import asyncio
+import logging
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod, DeleteMessage
+from aiogram.methods.base import TelegramType
+from services.throttling import RequestScheduler
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_AFTER = 10
+MAX_ATTEMPTS = 3
+CHAT_UNLIMITED_METHODS = (DeleteMessage,)
+
+
+class ThrottlingRequestMiddleware(BaseRequestMiddleware):
+    def __init__(
+            self,
+            scheduler: RequestScheduler,
+            max_retry_after: float = MAX_RETRY_AFTER,
+            max_attempts: int = MAX_ATTEMPTS):
+        self.scheduler = scheduler
+        self.max_retry_after = max_retry_after
+        self.max_attempts = max_attempts
+
+    async def __call__(
+            self,
+            make_request: NextRequestMiddlewareType[TelegramType],
+            bot: Bot,
+            method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id = getattr(method, 'chat_id', None)
+        if chat_id is None:
+            return await make_request(bot, method)
+        limited_chat_id = None if isinstance(method, CHAT_UNLIMITED_METHODS) else chat_id
+        attempt = 0
+        while True:
+            await self.scheduler.acquire(limited_chat_id)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                attempt += 1
+                self.scheduler.retry_after(chat_id, e.retry_after)
+                if e.retry_after > self.max_retry_after or attempt >= self.max_attempts:
+                    logger.warning('%s to chat %s gave up on flood control after %s attempts, retry after %ss',
+                                   type(method).__name__, chat_id, attempt, e.retry_after)
+                    raise
+                await asyncio.sleep(e.retry_after)
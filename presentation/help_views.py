@@ -41,10 +41,10 @@ HELP = {
     Если вы выбрали не то меню, нажмите на кнопку <b><i>Отменить</i></b>.
         
     <u>Порядок работы с позициями меню:</u>
-    <b>a)</b> Вывод позиций меню происходит последовательно. Сначала выводятся первые 5 позиций. Чтобы продолжить вывод списка позиций необходимо нажимать на кнопку <b><i>Продолжить список</i></b> до достижения окончания списка.
-    <b>b)</b> С помощью кнопок <b><i>-1</i></b> и <b><i>+1</i></b> настроить необходимое количество позиции данного меню.
-    <b>c)</b> Нажать на кнопку <b><i>Выбрать</i></b> под описанием позиции, которую хотите заказать.
-    <b>d)</b> Если вы добавили не ту позицию или не то количество, нажмите на кнопку <b><i>Отменить</i></b>.
+    <b>a)</b> Позиции меню выводятся в одном сообщении постранично, по 8 позиций на странице. Для перехода между страницами используйте кнопки <b><i>⏪</i></b> и <b><i>⏩</i></b>.
+    <b>b)</b> С помощью кнопок <b><i>➖</i></b> и <b><i>➕</i></b> рядом с номером позиции настройте необходимое количество. Текущее количество и сумма заказа отображаются в сообщении.
+    <b>c)</b> Чтобы убрать позицию из заказа, уменьшите ее количество до нуля.
+    <b>d)</b> Если вы хотите отказаться от заказа, нажмите на кнопку <b><i>Отменить</i></b>.
     <b>e)</b> После того, как вы выберете все позиции меню, которые хотите заказать, нажмите на кнопку <b><i>Подтвердить</i></b>.
     <b>f)</b> Если вы хотите заказать стандартный комплекс без выбора позиций и количества, нажмите на кнопку <b><i>Заказать стандартный комплекс</i></b>.
         
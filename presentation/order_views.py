@@ -1,5 +1,5 @@
 from prettytable import PrettyTable
-from services.models import DetailForm, OrderForm
+from services.models import OrderForm, MenuPage
 
 
 emoji_num_dict = {
@@ -36,14 +36,18 @@ def order_view(order_form: OrderForm):
     return '\n\n'.join(map(lambda s: f'<code>{s}</code>', [head, body.get_string(), tail]))
 
 
-def position_view_new(detail_form: DetailForm) -> str:
-    body = PrettyTable(field_names=['Наименование', 'Кол-во', 'Цена', 'Цвет'], padding_width=0)
-    body.add_row(
-        [
-            '\n'.join(map(lambda s: s.strip(), detail_form.menu_pos_name.split())),
-            detail_form.quantity,
-            detail_form.quantity * detail_form.menu_pos_cost,
-            emoji_num_dict.get(detail_form.color_num, '⚪')
-        ]
-    )
-    return f'<code>{body.get_string()}</code>'
+def menu_page_view(menu_page: MenuPage) -> str:
+    body = PrettyTable(field_names=['№', 'Наименование', 'Цена', 'Цвет', 'Кол-во'], padding_width=0)
+    for num, position in enumerate(menu_page.positions, start=menu_page.offset + 1):
+        body.add_row(
+            [
+                num,
+                '\n'.join(map(lambda s: s.strip(), position.name.split())),
+                position.cost,
+                emoji_num_dict.get(position.color_num, '⚪'),
+                menu_page.quantities.get(position.id, 0)
+            ],
+            divider=True
+        )
+    tail = f'Страница {menu_page.number + 1} из {menu_page.count}\nСумма заказа: {menu_page.amt}'
+    return '\n\n'.join(map(lambda s: f'<code>{s}</code>', [body.get_string(), tail]))
@@ -1,6 +1,8 @@
 import asyncio
+from aiogram import Bot
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove
 from aiogram.fsm.context import FSMContext
+from services.models import TrackCallback
 from services.other_services import add_message_to_track
 
 KeyboardMarkup = InlineKeyboardMarkup | ReplyKeyboardMarkup | ReplyKeyboardRemove
@@ -40,6 +42,20 @@ async def edit_response(
     )
 
 
+async def edit_tracked_response(
+        bot: Bot,
+        track_cb: TrackCallback,
+        text: str,
+        reply_markup: InlineKeyboardMarkup
+) -> None:
+    await bot.edit_message_text(
+        text=text,
+        chat_id=track_cb.chat_id,
+        message_id=track_cb.message_id,
+        reply_markup=reply_markup
+    )
+
+
 async def callback_response(
         callback: CallbackQuery,
         text: str | None = None,
@@ -1,5 +1,5 @@
-from database.models import DeliveryPlace
+from services.models import SDeliveryPlace
 
 
-def old_place_view(place: DeliveryPlace) -> str:
+def old_place_view(place: SDeliveryPlace) -> str:
     return f'Действующее место доставки: <b>{place.name}</b>'
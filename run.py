@@ -1,10 +1,19 @@
 import asyncio
 import logging
+import multiprocessing
 from aiogram import Bot, Dispatcher
 from aiogram.enums.parse_mode import ParseMode
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-from config import load_config, on_startup
-from middlewares import DbSessionMiddleware
+from redis.asyncio import Redis
+from config.storage import BoundedMemoryStorage
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from config import load_config, on_startup, on_shutdown
+from config.webhook import run_webhook
+from database.pool import create_engine, create_replica_engines
+from services.broadcast import Broadcaster
+from services.invalidation import InvalidationService
+from services.throttling import RequestScheduler, GLOBAL_RATE
+from middlewares import (DbSessionMiddleware, SessionStats, BufferedStateMiddleware, StateStats,
+                         ThrottlingRequestMiddleware)
 from handlers.other_handlers import router as other_router
 from handlers.command_handlers import router as command_router
 from handlers.order_handlers import router as order_router
@@ -14,26 +23,55 @@ from handlers.hd_handlers import router as hd_router
 logger = logging.getLogger(__name__)
 
 
-async def main():
+async def main(worker: int = 0):
     logging.basicConfig(
         level=logging.INFO,
         format='%(filename)s:%(lineno)d #%(levelname)-8s '
                '[%(asctime)s] - %(name)s - %(message)s'
     )
 
-    logger.info('Starting bot')
+    logger.info('Starting bot, worker %s', worker)
 
     config = load_config()
-
-    engine = create_async_engine(url=config.db.url, echo=True)
+    if config.webhook.workers > 1 and isinstance(config.bot.storage, BoundedMemoryStorage):
+        logger.warning('FSM state is not shared between webhook workers, set FSM_STORAGE=redis')
+    if config.redis_url:
+        await InvalidationService.start(Redis.from_url(config.redis_url))
+    elif config.webhook.workers > 1:
+        logger.warning('Caches are invalidated only in the current worker, set REDIS_URL')
+
+    engine = create_engine(config.db)
     session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    replica_engines = create_replica_engines(config.db)
+    replica_makers = [async_sessionmaker(replica, expire_on_commit=False) for replica in replica_engines]
+    session_stats = SessionStats()
+    state_stats = StateStats()
 
+    # every worker has its own scheduler, so the global Telegram limit is split evenly between them
+    request_scheduler = RequestScheduler(rate=GLOBAL_RATE / config.webhook.workers)
     bot = Bot(token=config.bot.token, parse_mode=ParseMode.HTML)
-    dp = Dispatcher(storage=config.bot.storage)
+    bot.session.middleware(ThrottlingRequestMiddleware(request_scheduler))
+    broadcaster = Broadcaster(bot=bot, session_pool=session_maker)
+    dp = Dispatcher(
+        storage=config.bot.storage,
+        events_isolation=config.bot.events_isolation,
+        engine=engine,
+        replica_engines=replica_engines,
+        session_stats=session_stats,
+        state_stats=state_stats,
+        broadcaster=broadcaster,
+        request_scheduler=request_scheduler,
+        webhook=config.webhook,
+        worker=worker
+    )
 
     dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
 
-    dp.update.middleware(DbSessionMiddleware(session_pool=session_maker))
+    dp.update.outer_middleware(BufferedStateMiddleware(stats=state_stats))
+    dp.update.middleware(
+        DbSessionMiddleware(session_pool=session_maker, stats=session_stats, replica_pools=replica_makers)
+    )
 
     dp.include_router(command_router)
     dp.include_router(user_router)
@@ -41,15 +79,30 @@ async def main():
     dp.include_router(hd_router)
     dp.include_router(other_router)
 
-    await bot.delete_webhook(drop_pending_updates=True)
-    await dp.start_polling(bot)
+    if config.webhook.enabled:
+        await run_webhook(dp, bot, config.webhook, worker)
+    else:
+        await bot.delete_webhook(drop_pending_updates=True)
+        await dp.start_polling(bot)
 
 
-if __name__ == '__main__':
+def run_worker(worker: int = 0) -> None:
     try:
-        asyncio.run(main())
+        asyncio.run(main(worker))
     except KeyboardInterrupt:
-        logger.info('Stopping bot')
+        logger.info('Stopping bot, worker %s', worker)
+
+
+if __name__ == '__main__':
+    webhook = load_config().webhook
+    if webhook.enabled and webhook.workers > 1:
+        processes = [multiprocessing.Process(target=run_worker, args=(worker,)) for worker in range(webhook.workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    else:
+        run_worker()
 
 
 
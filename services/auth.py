@@ -0,0 +1,109 @@
+import datetime
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.managers import DbSessionManager
+from database.models import Customer, CustomerPermission
+from services.invalidation import InvalidationService
+from services.models import SAuthCustomer
+
+AUTH_MAX_TTL = datetime.timedelta(hours=1)
+AUTH_NEGATIVE_TTL = datetime.timedelta(seconds=30)
+AUTH_CACHE_SIZE = 10000
+AUTH_SCOPE = 'auth'
+
+
+class AuthService:
+    _cache: dict[int, tuple[SAuthCustomer | None, datetime.datetime]] = {}
+
+    @classmethod
+    async def resolve(cls, session: AsyncSession, tg_id: int) -> SAuthCustomer | None:
+        now = datetime.datetime.now()
+        cached = cls._cache.get(tg_id)
+        if cached and now < cached[1]:
+            return cached[0]
+        customer = await cls._get_customer(session, tg_id=tg_id)
+        auth_customer, expires_at = cls._resolve_customer(customer, now)
+        if auth_customer is None:
+            expires_at = min(expires_at, now + AUTH_NEGATIVE_TTL)
+        cls._store(tg_id, auth_customer, expires_at, now)
+        return auth_customer
+
+    @classmethod
+    def _store(
+            cls,
+            tg_id: int,
+            auth_customer: SAuthCustomer | None,
+            expires_at: datetime.datetime,
+            now: datetime.datetime) -> None:
+        cls._cache.pop(tg_id, None)
+        if len(cls._cache) >= AUTH_CACHE_SIZE:
+            cls._cache = {key: value for key, value in cls._cache.items() if now < value[1]}
+        while len(cls._cache) >= AUTH_CACHE_SIZE:
+            cls._cache.pop(next(iter(cls._cache)))
+        cls._cache[tg_id] = (auth_customer, expires_at)
+
+    @classmethod
+    async def resolve_by_phone(cls, session: AsyncSession, phone_number: str) -> SAuthCustomer | None:
+        customer = await cls._get_customer(session, phone_number=phone_number)
+        return cls._resolve_customer(customer, datetime.datetime.now())[0]
+
+    @classmethod
+    async def is_auth(cls, session: AsyncSession, tg_id: int) -> bool:
+        auth_customer = await cls.resolve(session, tg_id)
+        return auth_customer is not None
+
+    @classmethod
+    async def invalidate(cls, tg_id: int | None = None) -> None:
+        await InvalidationService.invalidate(AUTH_SCOPE, tg_id)
+
+    @classmethod
+    def _drop(cls, tg_id: str | None) -> None:
+        if tg_id is None:
+            cls._cache.clear()
+        else:
+            cls._cache.pop(int(tg_id), None)
+
+    @classmethod
+    async def _get_customer(cls, session: AsyncSession, **kwargs) -> Customer | None:
+        return await DbSessionManager(session).get_obj_by_attrs(
+            Customer, options=[selectinload(Customer.permissions)], **kwargs
+        )
+
+    @classmethod
+    def _resolve_customer(
+            cls, customer: Customer | None, now: datetime.datetime) -> tuple[SAuthCustomer | None, datetime.datetime]:
+        expires_at = now + AUTH_MAX_TTL
+        if not customer:
+            return None, expires_at
+        today = now.date()
+        canteen_ids = sorted(set(
+            permission.canteen_id for permission in customer.permissions
+            if cls._is_valid_permission(permission, today)
+        ))
+        expires_at = min([expires_at, *cls._permission_boundaries(customer.permissions, today)])
+        if not canteen_ids:
+            return None, expires_at
+        return SAuthCustomer(
+            id=customer.id,
+            tg_id=customer.tg_id,
+            place_id=customer.place_id,
+            canteen_ids=canteen_ids
+        ), expires_at
+
+    @staticmethod
+    def _is_valid_permission(permission: CustomerPermission, today: datetime.date) -> bool:
+        return permission.beg_date <= today <= (permission.end_date or today)
+
+    @staticmethod
+    def _permission_boundaries(
+            permissions: list[CustomerPermission], today: datetime.date) -> list[datetime.datetime]:
+        boundaries = []
+        for permission in permissions:
+            if permission.beg_date > today:
+                boundaries.append(permission.beg_date)
+            elif permission.end_date and permission.end_date >= today:
+                boundaries.append(permission.end_date + datetime.timedelta(days=1))
+        return [datetime.datetime.combine(boundary, datetime.time.min) for boundary in boundaries]
+
+
+InvalidationService.register(AUTH_SCOPE, AuthService._drop)
@@ -0,0 +1,169 @@
+import asyncio
+import datetime
+import logging
+import os
+import socket
+import time
+from contextlib import suppress
+from aiogram import Bot
+from aiogram.exceptions import (TelegramAPIError, TelegramRetryAfter, TelegramBadRequest,
+                                TelegramNetworkError, TelegramServerError)
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from database.broadcast_dao import BroadcastRepository
+from database.hd_dao import HDRepository
+from services.throttling import background_requests
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+CONCURRENCY = 10
+MAX_ATTEMPTS = 3
+MAX_RETRY_WAIT = 60
+PROGRESS_INTERVAL = 10
+LEASE = datetime.timedelta(minutes=5)
+CLAIM_INTERVAL = 60
+
+
+def progress_text(sent: int, failed: int, total: int, finished: bool = False) -> str:
+    title = 'Рассылка завершена' if finished else 'Идет рассылка сообщений'
+    return f'{title}: отправлено {sent} из {total}, ошибок {failed}'
+
+
+class Broadcaster:
+
+    def __init__(
+            self,
+            bot: Bot,
+            session_pool: async_sessionmaker,
+            concurrency: int = CONCURRENCY,
+            batch_size: int = BATCH_SIZE):
+        self.bot = bot
+        self.session_pool = session_pool
+        self.batch_size = batch_size
+        self.owner = f'{socket.gethostname()}:{os.getpid()}'
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._watcher: asyncio.Task | None = None
+
+    async def start(self, admin_chat_id: int, msg_text: str) -> int:
+        async with self.session_pool() as session:
+            total = await HDRepository.count_bot_users(session)
+            progress_msg = await self.bot.send_message(chat_id=admin_chat_id, text=progress_text(0, 0, total))
+            broadcast_id = await BroadcastRepository.create_broadcast(
+                session,
+                {
+                    'admin_chat_id': admin_chat_id,
+                    'progress_message_id': progress_msg.message_id,
+                    'message_text': msg_text,
+                    'total': total
+                }
+            )
+            claimed = await BroadcastRepository.claim_broadcasts(session, self.owner, LEASE, broadcast_id)
+        if claimed:
+            self._spawn(broadcast_id)
+        return broadcast_id
+
+    async def resume(self) -> None:
+        async with self.session_pool() as session:
+            broadcast_ids = await BroadcastRepository.claim_broadcasts(session, self.owner, LEASE)
+        for broadcast_id in broadcast_ids:
+            if broadcast_id not in self._tasks:
+                logger.info('Resuming broadcast %s', broadcast_id)
+                self._spawn(broadcast_id)
+
+    def watch(self) -> None:
+        if self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def _watch(self) -> None:
+        while True:
+            try:
+                await self.resume()
+            except Exception:
+                logger.exception('Claiming unfinished broadcasts failed')
+            await asyncio.sleep(CLAIM_INTERVAL)
+
+    async def stop(self) -> None:
+        tasks = [*self._tasks.values(), *filter(None, [self._watcher])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _spawn(self, broadcast_id: int) -> None:
+        if broadcast_id not in self._tasks:
+            task = asyncio.create_task(self._run(broadcast_id))
+            task.add_done_callback(lambda _: self._tasks.pop(broadcast_id, None))
+            self._tasks[broadcast_id] = task
+
+    async def _run(self, broadcast_id: int) -> None:
+        with background_requests():
+            await self._broadcast(broadcast_id)
+
+    async def _broadcast(self, broadcast_id: int) -> None:
+        async with self.session_pool() as session:
+            broadcast = await BroadcastRepository.get_broadcast(session, broadcast_id)
+        last_tg_id, sent, failed = broadcast.last_tg_id, broadcast.sent, broadcast.failed
+        reported_at = time.monotonic()
+        try:
+            while True:
+                async with self.session_pool() as session:
+                    user_ids = await HDRepository.get_bot_users(session, last_tg_id, self.batch_size)
+                if not user_ids:
+                    break
+                results = await asyncio.gather(
+                    *(self._send(user_id, broadcast.message_text) for user_id in user_ids)
+                )
+                last_tg_id = user_ids[-1]
+                batch_sent = sum(results)
+                sent += batch_sent
+                failed += len(results) - batch_sent
+                async with self.session_pool() as session:
+                    owned = await BroadcastRepository.save_progress(
+                        session, broadcast_id, self.owner, LEASE, last_tg_id, batch_sent, len(results) - batch_sent
+                    )
+                if not owned:
+                    logger.warning('Broadcast %s was taken over by another worker after tg_id %s',
+                                   broadcast_id, last_tg_id)
+                    return
+                if time.monotonic() - reported_at >= PROGRESS_INTERVAL:
+                    await self._report(broadcast, sent, failed)
+                    reported_at = time.monotonic()
+            async with self.session_pool() as session:
+                await BroadcastRepository.finish_broadcast(session, broadcast_id, self.owner)
+            await self._report(broadcast, sent, failed, finished=True)
+            logger.info('Broadcast %s finished: sent %s, failed %s', broadcast_id, sent, failed)
+        except asyncio.CancelledError:
+            logger.info('Broadcast %s interrupted after tg_id %s', broadcast_id, last_tg_id)
+            raise
+        except Exception:
+            logger.exception('Broadcast %s failed after tg_id %s', broadcast_id, last_tg_id)
+
+    async def _send(self, chat_id: int, msg_text: str) -> bool:
+        async with self._semaphore:
+            attempt, retry_wait = 0, 0
+            while attempt < MAX_ATTEMPTS:
+                try:
+                    await self.bot.send_message(chat_id=chat_id, text=msg_text)
+                    return True
+                except TelegramRetryAfter as e:
+                    attempt += 1
+                    retry_wait += e.retry_after
+                    logger.warning('Flood control for %s (attempt %s), retry after %ss', chat_id, attempt, e.retry_after)
+                    if retry_wait > MAX_RETRY_WAIT:
+                        return False
+                except (TelegramNetworkError, TelegramServerError) as e:
+                    attempt += 1
+                    logger.warning('Sending to %s failed (attempt %s): %s', chat_id, attempt, e)
+                    await asyncio.sleep(attempt)
+                except TelegramAPIError as e:
+                    logger.info('Message to %s was not delivered: %s', chat_id, e)
+                    return False
+            return False
+
+    async def _report(self, broadcast, sent: int, failed: int, finished: bool = False) -> None:
+        with suppress(TelegramBadRequest, TelegramRetryAfter):
+            await self.bot.edit_message_text(
+                text=progress_text(sent, failed, broadcast.total, finished),
+                chat_id=broadcast.admin_chat_id,
+                message_id=broadcast.progress_message_id
+            )
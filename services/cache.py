@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, Iterable, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+
+V = TypeVar('V')
+
+
+class ReferenceTable(Generic[V]):
+
+    def __init__(self, loader: Callable[[AsyncSession], Awaitable[Iterable[V]]], ttl: float) -> None:
+        self._loader = loader
+        self._ttl = ttl
+        self._data: dict[int, V] | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _is_fresh(self) -> bool:
+        return self._data is not None and time.monotonic() < self._expires_at
+
+    async def get_all(self, session: AsyncSession) -> dict[int, V]:
+        if not self._is_fresh():
+            async with self._lock:
+                if not self._is_fresh():
+                    self.misses += 1
+                    self._data = {item.id: item for item in await self._loader(session)}
+                    self._expires_at = time.monotonic() + self._ttl
+                    return self._data
+        self.hits += 1
+        return self._data
+
+    async def get(self, session: AsyncSession, obj_id: int) -> V | None:
+        return (await self.get_all(session)).get(obj_id)
+
+    def invalidate(self) -> None:
+        self._data = None
+        self._expires_at = 0.0
+
+
+class KeyedCache(Generic[V]):
+
+    def __init__(self, loader: Callable[[AsyncSession, int], Awaitable[V | None]], ttl: float) -> None:
+        self._loader = loader
+        self._ttl = ttl
+        self._data: dict[int, tuple[V, float]] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh(self, key: int) -> V | None:
+        entry = self._data.get(key)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        self._data = {key: entry for key, entry in self._data.items() if now < entry[1]}
+
+    async def get(self, session: AsyncSession, key: int) -> V | None:
+        value = self._fresh(key)
+        if value is None:
+            lock = self._locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                value = self._fresh(key)
+                if value is None:
+                    self.misses += 1
+                    self._purge()
+                    value = await self._loader(session, key)
+                    if value is not None:
+                        self._data[key] = (value, time.monotonic() + self._ttl)
+                    self._locks.pop(key, None)
+                    return value
+        self.hits += 1
+        return value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def invalidate(self, key: int | None = None) -> None:
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
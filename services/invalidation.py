@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Callable
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'cache:invalidate'
+ALL_KEYS = '*'
+RECONNECT_DELAY = 1
+
+Handler = Callable[[str | None], None]
+
+
+class InvalidationService:
+    _handlers: dict[str, Handler] = {}
+    _redis: Redis | None = None
+    _listener: asyncio.Task | None = None
+
+    @classmethod
+    def register(cls, scope: str, handler: Handler) -> None:
+        cls._handlers[scope] = handler
+
+    @classmethod
+    async def invalidate(cls, scope: str, key: int | str | None = None) -> None:
+        key = None if key is None else str(key)
+        cls._apply(scope, key)
+        if cls._redis is not None:
+            try:
+                await cls._redis.publish(CHANNEL, f'{scope}:{ALL_KEYS if key is None else key}')
+            except RedisError as e:
+                logger.warning('Invalidation of %s:%s was not published: %s', scope, key, e)
+
+    @classmethod
+    def _apply(cls, scope: str, key: str | None) -> None:
+        handlers = cls._handlers.values() if scope == ALL_KEYS else filter(None, [cls._handlers.get(scope)])
+        for handler in handlers:
+            handler(key)
+
+    @classmethod
+    async def start(cls, redis: Redis, listen: bool = True) -> None:
+        cls._redis = redis
+        if listen:
+            cls._listener = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def _listen(cls) -> None:
+        while True:
+            pubsub = cls._redis.pubsub()
+            try:
+                await pubsub.subscribe(CHANNEL)
+                # messages published while we were not subscribed are lost
+                cls._apply(ALL_KEYS, None)
+                async for message in pubsub.listen():
+                    if message['type'] == 'message':
+                        scope, _, key = message['data'].decode().partition(':')
+                        cls._apply(scope, None if key == ALL_KEYS else key)
+            except RedisError as e:
+                logger.warning('Cache invalidation channel is lost, reconnecting: %s', e)
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                await pubsub.aclose()
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._listener is not None:
+            cls._listener.cancel()
+            await asyncio.gather(cls._listener, return_exceptions=True)
+            cls._listener = None
+        if cls._redis is not None:
+            await cls._redis.aclose()
+            cls._redis = None
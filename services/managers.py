@@ -1,48 +1,61 @@
 import datetime
-from typing import Generator, Any, Iterable
-from itertools import islice
+from dataclasses import replace
+from typing import Any
 from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
 from sqlalchemy.ext.asyncio import AsyncSession
-from services.models import OrderForm, UserForm, DetailForm, OrdersDLL, DataPosition
-from database.managers import DatabaseManager, DbSessionManager
-from database.models import (Canteen, DeliveryPlace, Menu, Order, OrderDetail, Customer,
-                             CustomerPermission, MenuPosition)
+from services.models import (OrderForm, UserForm, DetailForm, OrdersDLL, DataPosition, MenuPage,
+                             SAuthCustomer, SCanteen, SDeliveryPlace, SMenu, SMenuPosition,
+                             SMenuSlot)
+from services.auth import AuthService
+from services.serialization import dump_value, load_dataclass
+from services.reference import ReferenceService
+from services.menu import MenuService, ScheduleService
+from database.managers import DatabaseManager
+from database.order_dao import OrderRepository
+from database.models import Order, OrderDetail, Customer
 from exceptions import *
 
 
 class ServiceManager:
+    version = 2
 
     def __init__(self, model) -> None:
         self._model = model
         self._db = DatabaseManager()
 
+    def dump(self) -> dict[str, Any]:
+        return {'version': self.version, 'model': dump_value(self._model)}
+
+    @classmethod
+    def load(cls, data: dict[str, Any] | None) -> 'ServiceManager':
+        manager = cls()
+        if data and data.get('version') == cls.version:
+            manager._restore(data)
+        return manager
+
+    def _restore(self, data: dict[str, Any]) -> None:
+        self._model = load_dataclass(type(self._model), data['model'])
+
     def _set_attrs(self, **kwargs) -> None:
         for (key, value) in kwargs.items():
             setattr(self._model, key, value)
 
     async def _save(self, state: FSMContext) -> None:
-        await state.update_data({self.__class__.__name__: self})
+        await state.update_data({self.__class__.__name__: self.dump()})
 
-    async def _get_customer_from_msg(self, db_session: DbSessionManager, message: Message) -> Customer:
-        attr_dict = {'tg_id': message.from_user.id}
+    @staticmethod
+    async def _get_customer_from_msg(session: AsyncSession, message: Message) -> SAuthCustomer:
         if message.contact:
             raw_phone_number = message.contact.phone_number
             phone_number = raw_phone_number if len(raw_phone_number) == 12 else f'+{raw_phone_number}'
-            attr_dict = {'phone_number': phone_number}
-        customer = await db_session.get_obj_by_attrs(Customer, **attr_dict)
-        if await self._is_valid_customer(customer):
+            customer = await AuthService.resolve_by_phone(session, phone_number)
+        else:
+            customer = await AuthService.resolve(session, message.from_user.id)
+        if customer:
             return customer
         raise IsNotCustomer
 
-    async def _is_valid_customer(self, customer: Customer) -> bool:
-        return (customer and
-                any(filter(self._is_valid_permission, await customer.awaitable_attrs.permissions)))
-
-    @staticmethod
-    def _is_valid_permission(permission: CustomerPermission) -> bool:
-        return permission.beg_date <= datetime.date.today() <= (permission.end_date or datetime.date.today())
-
     @staticmethod
     def _get_id_from_callback(callback: CallbackQuery) -> int:
         return int(callback.data.split(':')[-1])
@@ -54,9 +67,8 @@ class UserManager(ServiceManager):
         super().__init__(UserForm())
 
     async def validate_customer(self, session: AsyncSession, message: Message, state: FSMContext) -> None:
-        db_session = self._db(session)
-        customer = await self._get_customer_from_msg(db_session, message)
-        valid_canteen_ids = await self._get_valid_canteen_ids(customer)
+        customer = await self._get_customer_from_msg(session, message)
+        valid_canteen_ids = self._get_valid_canteen_ids(customer)
         self._set_attrs(
             customer_id=customer.id,
             tg_id=message.from_user.id,
@@ -65,36 +77,31 @@ class UserManager(ServiceManager):
         )
         await self._save(state)
 
-    async def _get_valid_canteen_ids(self, customer: Customer) -> list[int]:
-        valid_canteen_ids = set(permission.canteen_id for permission in await customer.awaitable_attrs.permissions
-                                if self._is_valid_permission(permission))
-        if valid_canteen_ids:
-            return sorted(valid_canteen_ids)
+    @staticmethod
+    def _get_valid_canteen_ids(customer: SAuthCustomer) -> list[int]:
+        if customer.canteen_ids:
+            return customer.canteen_ids
         raise ValidCanteensNotExist
 
     def is_auth(self) -> bool:
         return bool(self._model.place_id and self._model.tg_id)
 
-    async def receive_place(self, session: AsyncSession) -> DeliveryPlace:
-        db_session = self._db(session)
-        return await db_session.get_obj_by_id(DeliveryPlace, self._model.place_id)
+    async def receive_place(self, session: AsyncSession) -> SDeliveryPlace:
+        return await ReferenceService.get_place(session, self._model.place_id)
 
     def allowed_several_canteens(self) -> bool:
         return len(self._model.canteen_ids) > 1
 
-    async def receive_canteens(self, session: AsyncSession) -> list[Canteen]:
-        db_session = self._db(session)
-        return [await db_session.get_obj_by_id(Canteen, canteen_id) for canteen_id in self._model.canteen_ids]
+    async def receive_canteens(self, session: AsyncSession) -> list[SCanteen]:
+        return await ReferenceService.get_canteens(session, self._model.canteen_ids)
 
     async def receive_canteen_places(
             self,
-            canteen: Canteen | None = None,
-            session: AsyncSession | None = None,
-            callback: CallbackQuery | None = None) -> list[DeliveryPlace]:
-        if not canteen:
-            db_session = self._db(session)
-            canteen = await db_session.get_obj_by_id(Canteen, self._get_id_from_callback(callback))
-        return [place for place in await canteen.awaitable_attrs.places if place.id != 58]
+            session: AsyncSession,
+            canteen: SCanteen | None = None,
+            callback: CallbackQuery | None = None) -> list[SDeliveryPlace]:
+        canteen_id = canteen.id if canteen else self._get_id_from_callback(callback)
+        return [place for place in await ReferenceService.get_canteen_places(session, canteen_id) if place.id != 58]
 
     async def authorize_customer(self, session: AsyncSession, callback: CallbackQuery) -> None:
         await self._update_customer_data(
@@ -115,6 +122,7 @@ class UserManager(ServiceManager):
             obj=await db_session.get_obj_by_id(Customer, self._model.customer_id),
             **kwargs
         )
+        await AuthService.invalidate(self._model.tg_id)
 
 
 class OrderManager(ServiceManager):
@@ -122,13 +130,20 @@ class OrderManager(ServiceManager):
     def __init__(self):
         super().__init__(OrderForm())
         self._dll = OrdersDLL()
-        self._offset = 5
+        self._page_size = 8
+
+    def dump(self) -> dict[str, Any]:
+        return {**super().dump(), 'orders': self._dll.data, 'position': dump_value(self._dll.data_position)}
+
+    def _restore(self, data: dict[str, Any]) -> None:
+        super()._restore(data)
+        self._dll.data = data['orders']
+        self._dll.data_position = load_dataclass(DataPosition, data['position'])
 
     async def start_process_new_order(
             self, session: AsyncSession, state: FSMContext, message: Message) -> None:
-        db_session = self._db(session)
-        customer = await self._get_customer_from_msg(db_session, message)
-        place = await db_session.get_obj_by_id(DeliveryPlace, customer.place_id)
+        customer = await self._get_customer_from_msg(session, message)
+        place = await ReferenceService.get_place(session, customer.place_id)
         self._set_attrs(
             customer_id=customer.id,
             canteen_id=place.canteen_id,
@@ -138,219 +153,187 @@ class OrderManager(ServiceManager):
         )
         await self._save(state)
 
-    async def receive_valid_menus(self, session: AsyncSession, state: FSMContext) -> list[Menu]:
-        db_session = self._db(session)
-        canteen = await db_session.get_obj_by_id(Canteen, self._model.canteen_id)
-        valid_menus = [
-            menu for menu in await canteen.awaitable_attrs.menus if await self._is_valid_menu(db_session, menu)
-        ]
+    async def receive_valid_menus(self, session: AsyncSession, state: FSMContext) -> list[SMenuSlot]:
+        valid_menus = await ScheduleService.get_open_menus(
+            session, self._model.canteen_id, self._model.customer_id
+        )
         if valid_menus:
+            canteen = await ReferenceService.get_canteen(session, self._model.canteen_id)
             self._set_attrs(canteen_name=canteen.name)
             await self._save(state)
             return valid_menus
         raise ValidMenusNotExist
 
-    async def _is_valid_menu(self, db_session: DbSessionManager, menu: Menu) -> bool:
-        order = await db_session.get_obj_by_attrs(Order, menu_id=menu.id, customer_id=self._model.customer_id)
-        return not order and (menu.beg_time <= datetime.datetime.now() <= menu.end_time)
-
-    async def _get_menu_info(self, db_session: DbSessionManager, menu_id: int) -> Menu:
-        menu = await db_session.get_obj_by_id(Menu, menu_id)
-        self._set_attrs(
-            menu_id=menu.id,
-            menu_name=menu.name,
-            menu_date=menu.date,
-            menu_end_time=menu.end_time
-        )
+    async def _get_menu_snapshot(self, session: AsyncSession, menu_id: int | None = None) -> SMenu:
+        menu = await MenuService.get_menu(session, menu_id or self._model.menu_id)
+        if menu_id:
+            self._set_attrs(
+                menu_id=menu.id,
+                menu_name=menu.name,
+                menu_date=menu.date,
+                menu_end_time=menu.end_time
+            )
         return menu
 
-    async def _get_raw_details_from_menu(self, menu: Menu) -> dict[int, DetailForm]:
+    def _menu_positions(self, menu: SMenu) -> tuple[SMenuPosition, ...]:
         if self.complex_menu():
-            raw_details = {
-                position.id: DetailForm(
-                    menu_pos_id=position.id,
-                    menu_pos_name=position.name,
-                    menu_pos_cost=position.cost * position.complex_qty if position.cost else 0,
-                    quantity=position.complex_qty,
-                    color_num=position.color_num
-                ) for position in await menu.awaitable_attrs.positions if position.complex_qty
-            }
-        else:
-            raw_details = {
-                position.id: DetailForm(
-                    menu_pos_id=position.id,
-                    menu_pos_name=position.name,
-                    menu_pos_cost=position.cost if position.cost else 0,
-                    color_num=position.color_num
-                ) for position in await menu.awaitable_attrs.positions
-            }
-        self._set_attrs(raw_details=raw_details)
-        return raw_details
+            return tuple(position for position in menu.positions if position.complex_qty)
+        return menu.positions
+
+    def _count_amt(self, menu: SMenu) -> None:
+        costs = {position.id: position.cost for position in menu.positions}
+        quantities = {pos_id: quantity for pos_id, quantity in self._model.quantities.items() if pos_id in costs}
+        self._set_attrs(
+            quantities=quantities,
+            amt=sum(costs[pos_id] * quantity for pos_id, quantity in quantities.items())
+        )
 
     async def receive_menu_positions(
-            self, session: AsyncSession, callback: CallbackQuery, state: FSMContext) -> tuple[DetailForm]:
-        db_session = self._db(session)
-        menu = await self._get_menu_info(db_session, self._get_id_from_callback(callback))
-        raw_details = await self._get_raw_details_from_menu(menu)
-        temp_details = self._chunked_by_offset(raw_details.values(), self._offset)
-        self._set_attrs(temp_details=temp_details)
-        result = next(self._model.temp_details)
+            self, session: AsyncSession, callback: CallbackQuery, state: FSMContext) -> MenuPage:
+        menu = await self._get_menu_snapshot(session, self._get_id_from_callback(callback))
+        self._set_attrs(page=0, quantities={}, amt=0)
         await self._save(state)
-        return result
-
-    @staticmethod
-    def _chunked_by_offset(iterable: Iterable, offset: int) -> Generator[Any, None, None]:
-        it = iter(iterable)
-        while batch := tuple(islice(it, offset)):
-            yield batch
+        return self._menu_page(menu)
+
+    def _menu_page(self, menu: SMenu) -> MenuPage:
+        positions = self._menu_positions(menu)
+        count = max(1, -(-len(positions) // self._page_size))
+        number = self._model.page % count
+        offset = number * self._page_size
+        return MenuPage(
+            positions=positions[offset:offset + self._page_size],
+            quantities=self._model.quantities,
+            number=number,
+            count=count,
+            offset=offset,
+            amt=self._model.amt
+        )
 
-    async def continue_receiving_positions(self, state: FSMContext) -> tuple[DetailForm]:
-        try:
-            result = next(self._model.temp_details)
-            await self._save(state)
-            return result
-        except StopIteration:
-            raise EmptyException
+    async def turn_menu_page(self, session: AsyncSession, callback: CallbackQuery, state: FSMContext) -> MenuPage:
+        menu = await self._get_menu_snapshot(session)
+        self._set_attrs(page=self._get_id_from_callback(callback))
+        await self._save(state)
+        return self._menu_page(menu)
 
     def complex_menu(self) -> bool:
         return not self._model.custom_menu
 
-    async def _get_details_from_complex_menu(self, menu: Menu) -> list[DetailForm]:
-        selected_details = [
-            DetailForm(
-                menu_pos_id=position.id,
-                menu_pos_name=position.name,
-                menu_pos_cost=position.cost if position.cost else 0,
-                quantity=position.complex_qty,
-                color_num=position.color_num
-            ) for position in await menu.awaitable_attrs.positions if position.complex_qty
-        ]
-        self._set_attrs(selected_details=selected_details)
-        return selected_details
-
     async def receive_complex_order(
             self, session: AsyncSession, state: FSMContext) -> OrderForm:
-        db_session = self._db(session)
-        menu = await self._get_menu_info(db_session, self._model.menu_id)
-        selected_details = await self._get_details_from_complex_menu(menu)
-        self._set_attrs(amt=sum(detail.menu_pos_cost * detail.quantity for detail in selected_details))
+        menu = await self._get_menu_snapshot(session)
+        self._set_attrs(quantities={position.id: position.complex_qty for position in menu.positions
+                                    if position.complex_qty})
+        self._count_amt(menu)
         await self._save(state)
-        return self.receive_full_order()
+        return await self.receive_full_order(session)
 
-    async def increment_position_quantity(self, callback: CallbackQuery, state: FSMContext) -> DetailForm:
-        detail: DetailForm = self._model.raw_details.get(self._get_id_from_callback(callback))
+    async def change_position_quantity(
+            self, session: AsyncSession, callback: CallbackQuery, state: FSMContext) -> MenuPage:
+        menu = await self._get_menu_snapshot(session)
+        menu_pos_id = self._get_id_from_callback(callback)
+        quantities = self._model.quantities
         if callback.data.startswith('plus'):
-            detail.quantity += 1
-        elif detail.quantity - 1 > 0:
-            detail.quantity -= 1
+            if menu_pos_id in quantities:
+                quantities[menu_pos_id] += 1
+            else:
+                position = next((position for position in menu.positions if position.id == menu_pos_id), None)
+                if position is None:
+                    raise InvalidPositionQuantity
+                quantities[menu_pos_id] = position.complex_qty if self.complex_menu() else 1
+        elif menu_pos_id in quantities:
+            quantities[menu_pos_id] -= 1
+            if not quantities[menu_pos_id]:
+                del quantities[menu_pos_id]
         else:
             raise InvalidPositionQuantity
+        self._count_amt(menu)
         await self._save(state)
-        return detail
-
-    async def add_position_to_order(self, callback: CallbackQuery, state: FSMContext) -> None:
-        detail: DetailForm = self._model.raw_details.get(self._get_id_from_callback(callback))
-        new_amt = detail.quantity * detail.menu_pos_cost + self._model.amt
-        self._set_attrs(amt=new_amt)
-        self._model.selected_details.append(detail)
-        await self._save(state)
+        return self._menu_page(menu)
 
-    def receive_full_order(self) -> OrderForm:
-        if not self._model.selected_details:
+    async def receive_full_order(self, session: AsyncSession) -> OrderForm:
+        if not self._model.quantities:
             raise NoPositionsSelected
-        return self._model
+        menu = await self._get_menu_snapshot(session)
+        return replace(
+            self._model,
+            selected_details=[
+                DetailForm(
+                    quantity=self._model.quantities[position.id],
+                    menu_pos_id=position.id,
+                    menu_pos_name=position.name,
+                    menu_pos_cost=position.cost,
+                    color_num=position.color_num
+                ) for position in menu.positions if position.id in self._model.quantities
+            ]
+        )
 
     async def confirm_pending_order(self, session: AsyncSession) -> None:
-        db_session = self._db(session)
-        order = self._create_order_from_model()
-        if await self._is_valid_order(db_session, order):
-            await db_session.save_new_obj(order)
-        else:
-            raise InvalidOrder
-
-    async def _is_valid_order(self, db_session: DbSessionManager, order: Order) -> bool:
-        customer = await db_session.get_obj_by_id(Customer, order.customer_id)
-        exist_orders = await db_session.get_objs_by_attrs(Order, customer_id=order.customer_id, menu_id=order.menu_id)
-        return (not exist_orders.all() and await self._is_valid_customer(customer)
-                and self._model.menu_end_time >= datetime.datetime.now())
-
-    def _create_order_from_model(self) -> Order:
-        order_details = [
-            OrderDetail(
-                menu_pos_id=detail.menu_pos_id,
-                quantity=detail.quantity
-            ) for detail in self._model.selected_details
-        ]
-        return Order(
-            created_at=datetime.datetime.now(),
-            amt=self._model.amt,
-            customer_id=self._model.customer_id,
-            menu_id=self._model.menu_id,
-            place_id=self._model.place_id,
-            details=order_details
+        result = await OrderRepository.create_order(
+            session,
+            order_data={
+                'created_at': datetime.datetime.now(),
+                'amt': self._model.amt,
+                'customer_id': self._model.customer_id,
+                'menu_id': self._model.menu_id,
+                'place_id': self._model.place_id
+            },
+            details=list(self._model.quantities.items())
         )
+        if result['order_id'] is None:
+            raise OrderAlreadyExists if result['conflict'] else InvalidOrder
 
     @staticmethod
-    async def _create_form_details_from_order_details(
-            db_session: DbSessionManager, order_details: list[OrderDetail]) -> list[DetailForm]:
-        details = []
-        for order_detail in order_details:
-            menu_pos = await db_session.get_obj_by_id(MenuPosition, order_detail.menu_pos_id)
-            details.append(
-                DetailForm(
-                    detail_id=order_detail.id,
-                    quantity=order_detail.quantity,
-                    menu_pos_id=menu_pos.id,
-                    menu_pos_name=menu_pos.name,
-                    menu_pos_cost=menu_pos.cost,
-                    color_num=menu_pos.color_num
-                )
-            )
-        return details
+    def _create_form_details_from_order_details(order_details: list[OrderDetail]) -> list[DetailForm]:
+        return [
+            DetailForm(
+                detail_id=order_detail.id,
+                quantity=order_detail.quantity,
+                menu_pos_id=order_detail.menu_position.id,
+                menu_pos_name=order_detail.menu_position.name,
+                menu_pos_cost=order_detail.menu_position.cost,
+                color_num=order_detail.menu_position.color_num
+            ) for order_detail in order_details
+        ]
 
-    async def _create_order_form_from_order(self, db_session, order: Order) -> OrderForm:
+    def _create_order_form_from_order(self, order: Order) -> OrderForm:
         if not order:
             raise OrdersNotExist
-        menu = await db_session.get_obj_by_id(Menu, order.menu_id)
-        place = await db_session.get_obj_by_id(DeliveryPlace, order.place_id)
-        canteen = await db_session.get_obj_by_id(Canteen, place.canteen_id)
-        details = await self._create_form_details_from_order_details(db_session, await order.awaitable_attrs.details)
         return OrderForm(
             order_id=order.id,
+            customer_id=order.customer_id,
             created_at=order.created_at,
             sent_to_eis=order.sent_to_eis,
             amt=order.amt,
-            canteen_name=canteen.name,
-            place_name=place.name,
-            custom_menu=place.custom_menu,
-            menu_name=menu.name,
-            menu_date=menu.date,
-            menu_end_time=menu.end_time,
-            selected_details=details
+            canteen_name=order.place.canteen.name,
+            place_name=order.place.name,
+            custom_menu=order.place.custom_menu,
+            menu_name=order.menu.name,
+            menu_date=order.menu.date,
+            menu_end_time=order.menu.end_time,
+            selected_details=self._create_form_details_from_order_details(order.details)
         )
 
     async def receive_customer_orders(
             self, session: AsyncSession, message: Message, state: FSMContext, valid: bool) -> None:
-        db_session = self._db(session)
-        customer = await self._get_customer_from_msg(db_session, message)
-        data = [await self._create_order_form_from_order(db_session, order)
-                for order in await customer.awaitable_attrs.orders]
-        if valid:
-            data = list(filter(self.is_valid_order_form, data))
+        customer = await self._get_customer_from_msg(session, message)
+        order_ids = await OrderRepository.get_customer_order_ids(session, customer.id, active_only=valid)
         try:
-            self._dll.set_data(data)
+            self._dll.set_data(list(order_ids))
+            self._set_attrs(customer_id=customer.id)
             await self._save(state)
         except EmptyException:
             raise OrdersNotExist
 
-    @staticmethod
-    def is_valid_order_form(order_form) -> bool:
-        if not order_form.sent_to_eis and order_form.menu_end_time >= datetime.datetime.now():
-            return True
-        return False
-
-    def current_order(self) -> OrderForm:
-        return self._dll.get_cur_data()
+    async def current_order(self, session: AsyncSession, state: FSMContext) -> OrderForm:
+        while True:
+            try:
+                order = await OrderRepository.get_order(session, self._dll.get_cur_data())
+            except EmptyException:
+                raise OrdersNotExist
+            if order:
+                return self._create_order_form_from_order(order)
+            self._dll.delete_cur_data()
+            await self._save(state)
 
     def current_order_position(self) -> DataPosition:
         return self._dll.data_position
@@ -362,12 +345,8 @@ class OrderManager(ServiceManager):
             self._dll.turn_prev()
         await self._save(state)
 
-    async def valid_order_to_delete(self, state: FSMContext) -> OrderForm | None:
-        order_form = self._dll.delete_cur_data()
+    async def cancel_current_order(self, session: AsyncSession, state: FSMContext) -> bool:
+        order_id = self._dll.delete_cur_data()
         await self._save(state)
-        if self.is_valid_order_form(order_form):
-            return order_form
-
-    async def cancel_order(self, session: AsyncSession, order_form: OrderForm) -> None:
-        db_session = self._db(session)
-        await db_session.delete_obj_by_id(Order, order_form.order_id)
+        deleted_id = await OrderRepository.cancel_order(session, order_id, self._model.customer_id)
+        return deleted_id is not None
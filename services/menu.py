@@ -0,0 +1,181 @@
+import asyncio
+import datetime
+import time
+from bisect import bisect_right
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.managers import DbSessionManager
+from database.models import Menu
+from database.order_dao import OrderRepository
+from services.cache import KeyedCache
+from services.invalidation import InvalidationService
+from services.models import SMenu, SMenuPosition, SMenuSlot
+from exceptions import InvalidOrderMenu
+
+MENU_TTL = 5 * 60
+SCHEDULE_TTL = 60
+MENU_SCOPE = 'menu'
+
+
+async def _load_menu(session: AsyncSession, menu_id: int) -> SMenu | None:
+    menu = await DbSessionManager(session).get_obj_by_id(Menu, menu_id, options=[selectinload(Menu.positions)])
+    if not menu:
+        return None
+    return SMenu(
+        id=menu.id,
+        name=menu.name,
+        date=menu.date,
+        end_time=menu.end_time,
+        positions=tuple(
+            SMenuPosition(
+                id=position.id,
+                name=position.name,
+                cost=position.cost or 0,
+                complex_qty=position.complex_qty,
+                color_num=position.color_num
+            ) for position in sorted(menu.positions, key=lambda position: position.id)
+        )
+    )
+
+
+class MenuService:
+    menus: KeyedCache[SMenu] = KeyedCache(_load_menu, MENU_TTL)
+
+    @classmethod
+    async def get_menu(cls, session: AsyncSession, menu_id: int) -> SMenu:
+        menu = await cls.menus.get(session, menu_id)
+        if menu is None:
+            raise InvalidOrderMenu
+        return menu
+
+    @classmethod
+    def invalidate(cls, menu_id: int | None = None) -> None:
+        cls.menus.invalidate(menu_id)
+
+    @classmethod
+    def stats(cls) -> tuple[int, int, int]:
+        return cls.menus.hits, cls.menus.misses, len(cls.menus)
+
+
+class CanteenSchedule:
+
+    def __init__(self, slots: list[SMenuSlot]) -> None:
+        self._build(slots)
+
+    def _build(self, slots: list[SMenuSlot]) -> None:
+        self._slots = sorted(slots, key=lambda slot: (slot.beg_time, slot.id))
+        self._begins = [slot.beg_time for slot in self._slots]
+        self._next_close = min((slot.end_time for slot in self._slots), default=None)
+
+    def _prune(self, moment: datetime.datetime) -> None:
+        if self._next_close is not None and moment > self._next_close:
+            self._build([slot for slot in self._slots if slot.end_time >= moment])
+
+    def open_at(self, moment: datetime.datetime) -> list[SMenuSlot]:
+        self._prune(moment)
+        return sorted(self._slots[:bisect_right(self._begins, moment)], key=lambda slot: (slot.date, slot.id))
+
+    def next_transition(self, moment: datetime.datetime) -> datetime.datetime | None:
+        self._prune(moment)
+        ind = bisect_right(self._begins, moment)
+        transitions = [slot.end_time for slot in self._slots[:ind]]
+        if ind < len(self._begins):
+            transitions.append(self._begins[ind])
+        return min(transitions, default=None)
+
+
+class MenuSchedule:
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._canteens: dict[int, CanteenSchedule] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() < self._expires_at
+
+    async def _refresh(self, session: AsyncSession) -> None:
+        if not self._is_fresh():
+            async with self._lock:
+                if not self._is_fresh():
+                    self.misses += 1
+                    menus = await DbSessionManager(session).get_objs_by_filter(
+                        Menu, Menu.end_time >= datetime.datetime.now(), order_by=[Menu.beg_time, Menu.id]
+                    )
+                    slots: dict[int, list[SMenuSlot]] = {}
+                    for menu in menus:
+                        slots.setdefault(menu.canteen_id, []).append(
+                            SMenuSlot(
+                                id=menu.id,
+                                name=menu.name,
+                                date=menu.date,
+                                beg_time=menu.beg_time,
+                                end_time=menu.end_time,
+                                canteen_id=menu.canteen_id
+                            )
+                        )
+                    self._canteens = {canteen_id: CanteenSchedule(items) for canteen_id, items in slots.items()}
+                    self._expires_at = time.monotonic() + self._ttl
+                    return
+        self.hits += 1
+
+    async def open_menus(
+            self,
+            session: AsyncSession,
+            canteen_id: int,
+            moment: datetime.datetime | None = None) -> list[SMenuSlot]:
+        await self._refresh(session)
+        schedule = self._canteens.get(canteen_id)
+        return schedule.open_at(moment or datetime.datetime.now()) if schedule else []
+
+    async def next_transition(
+            self,
+            session: AsyncSession,
+            canteen_id: int,
+            moment: datetime.datetime | None = None) -> datetime.datetime | None:
+        await self._refresh(session)
+        schedule = self._canteens.get(canteen_id)
+        return schedule.next_transition(moment or datetime.datetime.now()) if schedule else None
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+
+class ScheduleService:
+    schedule = MenuSchedule(SCHEDULE_TTL)
+
+    @classmethod
+    async def get_open_menus(
+            cls,
+            session: AsyncSession,
+            canteen_id: int,
+            customer_id: int,
+            moment: datetime.datetime | None = None) -> list[SMenuSlot]:
+        menus = await cls.schedule.open_menus(session, canteen_id, moment)
+        if not menus:
+            return menus
+        ordered = await OrderRepository.get_ordered_menu_ids(session, customer_id, [menu.id for menu in menus])
+        return [menu for menu in menus if menu.id not in ordered]
+
+    @classmethod
+    async def next_transition(cls, session: AsyncSession, canteen_id: int) -> datetime.datetime | None:
+        return await cls.schedule.next_transition(session, canteen_id)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls.schedule.invalidate()
+
+    @classmethod
+    def stats(cls) -> tuple[int, int]:
+        return cls.schedule.hits, cls.schedule.misses
+
+
+def _drop_menus(menu_id: str | None) -> None:
+    MenuService.invalidate(None if menu_id is None else int(menu_id))
+    ScheduleService.invalidate()
+
+
+InvalidationService.register(MENU_SCOPE, _drop_menus)
@@ -1,15 +1,15 @@
 from dataclasses import dataclass, field
 from decimal import Decimal
 import datetime
-from typing import Generator, Optional
-from aiogram.types import Message
+from typing import Optional
 import pydantic
 from exceptions import EmptyException
 
 
 @dataclass
 class TrackCallback:
-    message: Message
+    chat_id: int
+    message_id: int
     callback_data: str
 
 
@@ -47,11 +47,21 @@ class OrderForm:
     menu_name: str = field(default=None)
     menu_date: datetime.date = field(default=None)
     menu_end_time: datetime.datetime = field(default=None)
-    raw_details: dict[int, DetailForm] = field(default_factory=dict)
-    temp_details: Generator[DetailForm, None, None] = field(default=None)
+    quantities: dict[int, int] = field(default_factory=dict)
+    page: int = field(default=0)
     selected_details: list[DetailForm] = field(default_factory=list)
 
 
+@dataclass
+class MenuPage:
+    positions: tuple['SMenuPosition', ...]
+    quantities: dict[int, int]
+    number: int
+    count: int
+    offset: int
+    amt: Decimal
+
+
 @dataclass
 class DataPosition:
     prev_ind: int = field(default=0)
@@ -59,7 +69,7 @@ class DataPosition:
     next_ind: int = field(default=0)
     size: int = field(default=0)
 
-    def handling_data(self, data: list[OrderForm]):
+    def handling_data(self, data: list[int]):
         if len(data) >= 1:
             self.cur_ind = 0
             self.prev_ind = len(data) - 1
@@ -96,13 +106,13 @@ class DataPosition:
 class OrdersDLL:
 
     def __init__(self) -> None:
-        self.data: list[OrderForm] | None = None
+        self.data: list[int] | None = None
         self.data_position = DataPosition()
 
     def _initialize_model(self):
         self.data_position.handling_data(self.data)
 
-    def set_data(self, data: list[OrderForm]) -> None:
+    def set_data(self, data: list[int]) -> None:
         if not data:
             raise EmptyException
         self.data = data
@@ -114,12 +124,12 @@ class OrdersDLL:
     def turn_prev(self) -> None:
         self.data_position.step_left()
 
-    def get_cur_data(self) -> OrderForm:
+    def get_cur_data(self) -> int:
         if self.data_position.is_empty():
             raise EmptyException
         return self.data[self.data_position.cur_ind]
 
-    def delete_cur_data(self) -> OrderForm:
+    def delete_cur_data(self) -> int:
         if self.data_position.is_empty():
             raise EmptyException
         self.data_position.decrement_size()
@@ -128,6 +138,64 @@ class OrdersDLL:
         return result
 
 
+class SAuthCustomer(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    id: int
+    tg_id: Optional[int] = None
+    place_id: Optional[int] = None
+    canteen_ids: list[int]
+
+
+class SCanteen(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    id: int
+    name: str
+
+
+class SDeliveryPlace(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    canteen_id: int
+    custom_menu: bool
+    begin_date: datetime.date
+    end_date: Optional[datetime.date] = None
+
+
+class SMenuPosition(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    cost: Decimal
+    complex_qty: Optional[int] = None
+    color_num: Optional[int] = None
+
+
+class SMenu(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    date: datetime.date
+    end_time: datetime.datetime
+    positions: tuple[SMenuPosition, ...]
+
+
+class SMenuSlot(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    date: datetime.date
+    beg_time: datetime.datetime
+    end_time: datetime.datetime
+    canteen_id: int
+
+
 class SHDType(pydantic.BaseModel):
     id: int
     name: str
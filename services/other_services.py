@@ -1,27 +1,41 @@
+import asyncio
+import logging
 from typing import Any
 from contextlib import suppress
 from aiogram import Bot
 from aiogram.types import CallbackQuery, Message
 from aiogram.fsm.context import FSMContext
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
 from services.models import TrackCallback
+from services.serialization import dump_value, load_dataclass
+from services.throttling import background_requests
+
+logger = logging.getLogger(__name__)
+
+DELETE_BATCH_SIZE = 100
+DELETE_CONCURRENCY = 5
+TRACK_MESSAGES_LIMIT = 50
+
+_cleanup_tasks: set[asyncio.Task] = set()
 
 
 async def add_message_to_track(message: Message, state: FSMContext) -> None:
     data: dict[str, Any] = await state.get_data()
-    track_list: list | None = data.get('track_messages')
-    if track_list:
-        track_list.append(message.message_id)
-    else:
-        track_list = [message.message_id]
+    track_list: list[int] = [*data.get('track_messages', []), message.message_id]
+    if len(track_list) > TRACK_MESSAGES_LIMIT:
+        overflow, track_list = track_list[:-TRACK_MESSAGES_LIMIT], track_list[-TRACK_MESSAGES_LIMIT:]
+        _erase_in_background(message.bot, message.chat.id, overflow)
     await state.update_data(track_messages=track_list)
 
 
 async def set_track_callback(callback: CallbackQuery, message: Message, state: FSMContext) -> None:
     await state.update_data(
-        cb=TrackCallback(
-            message=message,
-            callback_data=callback.data
+        cb=dump_value(
+            TrackCallback(
+                chat_id=message.chat.id,
+                message_id=message.message_id,
+                callback_data=callback.data
+            )
         )
     )
 
@@ -30,27 +44,49 @@ async def get_track_callback(state: FSMContext) -> TrackCallback | None:
     data = await state.get_data()
     track_cb = data.get('cb')
     if track_cb:
-        return track_cb
+        return load_dataclass(TrackCallback, track_cb)
 
 
 async def update_track_callback(track_cb: TrackCallback, callback: CallbackQuery, state: FSMContext) -> None:
     track_cb.callback_data = callback.data
-    await state.update_data(cb=track_cb)
+    await state.update_data(cb=dump_value(track_cb))
 
 
-async def _erase_track_messages(state: FSMContext, bot: Bot, chat_id: int) -> None:
-    data: dict[str, Any] = await state.get_data()
-    track_msgs = data.get('track_messages')
-    if track_msgs:
-        for msg_id in track_msgs:
+async def _delete_messages(bot: Bot, chat_id: int, msg_ids: list[int]) -> None:
+    if hasattr(bot, 'delete_messages'):
+        for ind in range(0, len(msg_ids), DELETE_BATCH_SIZE):
+            with suppress(TelegramBadRequest):
+                await bot.delete_messages(chat_id=chat_id, message_ids=msg_ids[ind:ind + DELETE_BATCH_SIZE])
+        return
+    semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+
+    async def delete_message(msg_id: int) -> None:
+        async with semaphore:
             with suppress(TelegramBadRequest):
                 await bot.delete_message(chat_id=chat_id, message_id=msg_id)
 
+    await asyncio.gather(*(delete_message(msg_id) for msg_id in msg_ids))
+
+
+async def _erase_track_messages(bot: Bot, chat_id: int, msg_ids: list[int]) -> None:
+    with background_requests():
+        try:
+            await _delete_messages(bot, chat_id, msg_ids)
+        except TelegramAPIError as e:
+            logger.warning('Tracked messages in chat %s were not deleted: %s', chat_id, e)
+
+
+def _erase_in_background(bot: Bot, chat_id: int, msg_ids: list[int]) -> None:
+    task = asyncio.create_task(_erase_track_messages(bot, chat_id, msg_ids))
+    _cleanup_tasks.add(task)
+    task.add_done_callback(_cleanup_tasks.discard)
+
 
 async def terminate_state_branch(message: Message, state: FSMContext, add_last: bool = True) -> None:
     if add_last:
         await add_message_to_track(message, state)
-    await _erase_track_messages(state, message.bot, message.chat.id)
+    data: dict[str, Any] = await state.get_data()
+    track_msgs = data.get('track_messages')
     await state.clear()
-
-
+    if track_msgs:
+        _erase_in_background(message.bot, message.chat.id, track_msgs)
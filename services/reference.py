@@ -0,0 +1,87 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.managers import DbSessionManager
+from database.hd_dao import HDRepository
+from database.models import Canteen, DeliveryPlace
+from services.cache import ReferenceTable
+from services.invalidation import InvalidationService
+from services.models import SCanteen, SDeliveryPlace, SHDType
+
+REFERENCE_TTL = 60 * 60
+REFERENCE_SCOPE = 'reference'
+
+
+async def _load_canteens(session: AsyncSession) -> list[SCanteen]:
+    canteens = await DbSessionManager(session).get_objs_by_attrs(Canteen)
+    return [SCanteen(id=canteen.id, name=canteen.name) for canteen in canteens]
+
+
+async def _load_places(session: AsyncSession) -> list[SDeliveryPlace]:
+    places = await DbSessionManager(session).get_objs_by_attrs(DeliveryPlace)
+    return [
+        SDeliveryPlace(
+            id=place.id,
+            name=place.name,
+            canteen_id=place.canteen_id,
+            custom_menu=place.custom_menu,
+            begin_date=place.begin_date,
+            end_date=place.end_date
+        ) for place in places
+    ]
+
+
+async def _load_hd_types(session: AsyncSession) -> list[SHDType]:
+    hd_types = await HDRepository.get_all_types(session)
+    return [SHDType(id=hd_type.id, name=hd_type.name) for hd_type in hd_types]
+
+
+class ReferenceService:
+    canteens: ReferenceTable[SCanteen] = ReferenceTable(_load_canteens, REFERENCE_TTL)
+    places: ReferenceTable[SDeliveryPlace] = ReferenceTable(_load_places, REFERENCE_TTL)
+    hd_types: ReferenceTable[SHDType] = ReferenceTable(_load_hd_types, REFERENCE_TTL)
+
+    @classmethod
+    async def get_canteen(cls, session: AsyncSession, canteen_id: int) -> SCanteen | None:
+        return await cls.canteens.get(session, canteen_id)
+
+    @classmethod
+    async def get_canteens(cls, session: AsyncSession, canteen_ids: list[int]) -> list[SCanteen]:
+        canteens = await cls.canteens.get_all(session)
+        return [canteens[canteen_id] for canteen_id in canteen_ids if canteen_id in canteens]
+
+    @classmethod
+    async def get_place(cls, session: AsyncSession, place_id: int) -> SDeliveryPlace | None:
+        return await cls.places.get(session, place_id)
+
+    @classmethod
+    async def get_canteen_places(cls, session: AsyncSession, canteen_id: int) -> list[SDeliveryPlace]:
+        places = await cls.places.get_all(session)
+        return [place for place in places.values() if place.canteen_id == canteen_id]
+
+    @classmethod
+    async def get_hd_types(cls, session: AsyncSession) -> list[SHDType]:
+        hd_types = await cls.hd_types.get_all(session)
+        return sorted(hd_types.values(), key=lambda hd_type: hd_type.id)
+
+    @classmethod
+    async def invalidate(cls) -> None:
+        await InvalidationService.invalidate(REFERENCE_SCOPE)
+
+    @classmethod
+    def _drop(cls, _: str | None = None) -> None:
+        for table in cls._tables().values():
+            table.invalidate()
+
+    @classmethod
+    def stats(cls) -> dict[str, tuple[int, int]]:
+        return {name: (table.hits, table.misses) for name, table in cls._tables().items()}
+
+    @classmethod
+    def _tables(cls) -> dict[str, ReferenceTable]:
+        return {
+            'canteens': cls.canteens,
+            'places': cls.places,
+            'hd_types': cls.hd_types
+        }
+
+
+InvalidationService.register(REFERENCE_SCOPE, ReferenceService._drop)
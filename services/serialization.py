@@ -0,0 +1,50 @@
+import datetime
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from typing import Any, get_args, get_origin, get_type_hints, Union
+from types import UnionType
+
+
+def dump_value(value: Any) -> Any:
+    if is_dataclass(value):
+        return {field.name: dump_value(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [dump_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): dump_value(item) for key, item in value.items()}
+    return value
+
+
+def load_value(tp: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    origin = get_origin(tp)
+    if origin in (Union, UnionType):
+        return load_value(next(arg for arg in get_args(tp) if arg is not type(None)), value)
+    if origin in (list, tuple):
+        item_tp, *_ = get_args(tp)
+        return origin(load_value(item_tp, item) for item in value)
+    if origin is dict:
+        key_tp, item_tp = get_args(tp)
+        return {load_value(key_tp, key): load_value(item_tp, item) for key, item in value.items()}
+    if is_dataclass(tp):
+        return load_dataclass(tp, value)
+    if tp is datetime.datetime:
+        return datetime.datetime.fromisoformat(value)
+    if tp is datetime.date:
+        return datetime.date.fromisoformat(value)
+    if tp in (Decimal, int):
+        return tp(value)
+    return value
+
+
+def load_dataclass(cls: type, data: dict[str, Any]) -> Any:
+    hints = get_type_hints(cls)
+    return cls(**{
+        field.name: load_value(hints[field.name], data[field.name])
+        for field in fields(cls) if field.init and field.name in data
+    })
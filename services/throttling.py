@@ -0,0 +1,159 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Iterator
+
+GLOBAL_RATE = 28
+CHAT_RATE = 1
+CHAT_BURST = 3
+MAX_CHATS = 10000
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+request_priority: ContextVar[Priority] = ContextVar('request_priority', default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def background_requests() -> Iterator[None]:
+    token = request_priority.set(Priority.BACKGROUND)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class TokenBucket:
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def is_idle(self) -> bool:
+        now = time.monotonic()
+        self._refill(now)
+        return self._tokens >= self.capacity and now >= self._paused_until
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+
+
+@dataclass
+class SchedulerMetrics:
+    requests: int = field(default=0)
+    retries: int = field(default=0)
+    queue_depth: dict[str, int] = field(default_factory=dict)
+    max_queue_depth: int = field(default=0)
+    wait_time: float = field(default=0)
+    max_wait_time: float = field(default=0)
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.wait_time / self.requests if self.requests else 0
+
+
+class RequestScheduler:
+
+    def __init__(
+            self,
+            rate: float = GLOBAL_RATE,
+            chat_rate: float = CHAT_RATE,
+            chat_burst: float = CHAT_BURST,
+            max_chats: int = MAX_CHATS):
+        self._bucket = TokenBucket(rate)
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._max_chats = max_chats
+        self._chats: dict[int | str, TokenBucket] = {}
+        self._queues: dict[Priority, deque[asyncio.Future]] = {priority: deque() for priority in Priority}
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+        self._metrics = SchedulerMetrics()
+
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self._max_chats:
+                self._chats = {key: value for key, value in self._chats.items() if not value.is_idle()}
+            bucket = self._chats[chat_id] = TokenBucket(self._chat_rate, self._chat_burst)
+        return bucket
+
+    def _queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _release_next(self) -> None:
+        for priority in Priority:
+            queue = self._queues[priority]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+
+    async def _dispatch(self) -> None:
+        while True:
+            if not self._queued():
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self._bucket.acquire()
+            self._release_next()
+
+    async def acquire(self, chat_id: int | str | None) -> None:
+        started = time.monotonic()
+        if chat_id is not None:
+            await self._chat_bucket(chat_id).acquire()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._dispatch())
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues[request_priority.get()].append(waiter)
+        self._metrics.max_queue_depth = max(self._metrics.max_queue_depth, self._queued())
+        self._wakeup.set()
+        await waiter
+        waited = time.monotonic() - started
+        self._metrics.requests += 1
+        self._metrics.wait_time += waited
+        self._metrics.max_wait_time = max(self._metrics.max_wait_time, waited)
+
+    def retry_after(self, chat_id: int | str, seconds: float) -> None:
+        self._metrics.retries += 1
+        self._chat_bucket(chat_id).pause(seconds)
+        if request_priority.get() is Priority.BACKGROUND:
+            self._bucket.pause(seconds)
+
+    def metrics(self) -> SchedulerMetrics:
+        self._metrics.queue_depth = {priority.name.lower(): len(queue) for priority, queue in self._queues.items()}
+        return self._metrics
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()